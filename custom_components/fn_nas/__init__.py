@@ -17,25 +17,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     config = {**entry.data, **entry.options}
     coordinator = FlynasCoordinator(hass, config, entry)
     # 直接初始化，不阻塞等待NAS上线
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+    # 单条entry的状态放在entry.runtime_data上，省去hass.data的两级字典查找
+    entry.runtime_data = {
         DATA_UPDATE_COORDINATOR: coordinator,
         "ups_coordinator": None,
         CONF_ENABLE_DOCKER: coordinator.config.get(CONF_ENABLE_DOCKER, False)
     }
-    # 异步后台初始化
-    hass.async_create_task(async_delayed_setup(hass, entry, coordinator))
+    # 异步后台初始化，eager_start避免多等一个事件循环周期
+    # 保留任务引用，避免任务被垃圾回收
+    entry.runtime_data["setup_task"] = hass.async_create_task(
+        async_delayed_setup(hass, entry, coordinator), eager_start=True
+    )
     return True
 
+async def _async_cancel_task(task):
+    """取消任务并等待其真正结束，确保finally块得以执行"""
+    if not task or task.done():
+        return
+    task.cancel()
+    try:
+        await asyncio.wait_for(asyncio.shield(asyncio.wait({task})), timeout=5)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        pass
+
 async def async_delayed_setup(hass: HomeAssistant, entry: ConfigEntry, coordinator: FlynasCoordinator):
     try:
-        # 检查配置条目状态，只有在 SETUP_IN_PROGRESS 时才调用 async_config_entry_first_refresh
-        from homeassistant.config_entries import ConfigEntryState
-        if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
-            await coordinator.async_config_entry_first_refresh()
-        else:
-            # 如果配置条目已经加载，则直接刷新数据
-            await coordinator.async_refresh()
         enable_docker = coordinator.config.get(CONF_ENABLE_DOCKER, False)
         if enable_docker:
             from .docker_manager import DockerManager
@@ -45,31 +51,46 @@ async def async_delayed_setup(hass: HomeAssistant, entry: ConfigEntry, coordinat
             coordinator.docker_manager = None
             _LOGGER.debug("未启用Docker容器监控")
         ups_coordinator = UPSDataUpdateCoordinator(hass, coordinator.config, coordinator)
+        # 检查配置条目状态，只有在 SETUP_IN_PROGRESS 时才调用 async_config_entry_first_refresh
+        from homeassistant.config_entries import ConfigEntryState
         if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
-            await ups_coordinator.async_config_entry_first_refresh()
+            await coordinator.async_config_entry_first_refresh()
         else:
-            await ups_coordinator.async_refresh()
-        hass.data[DOMAIN][entry.entry_id]["ups_coordinator"] = ups_coordinator
+            # 如果配置条目已经加载，则直接刷新数据
+            await coordinator.async_refresh()
+        # UPS数据不阻塞平台加载，首次刷新放到后台执行
+        _LOGGER.debug("UPS数据获取转入后台执行")
+        hass.async_create_task(ups_coordinator.async_refresh(), eager_start=True)
+        entry.runtime_data["ups_coordinator"] = ups_coordinator
+        # 预先整理好各平台需要的索引，避免每个平台重复遍历原始列表
+        entry.runtime_data.update({
+            "disks_by_device": coordinator.data.get("disks_by_device", {}),
+            "vms_by_name": coordinator.data.get("vms_by_name", {}),
+            "containers_by_name": coordinator.data.get("containers_by_name", {}),
+            "zpools": coordinator.data.get("zpools", []),
+        })
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         entry.async_on_unload(entry.add_update_listener(async_update_entry))
         _LOGGER.info("飞牛NAS集成初始化完成")
     except Exception as e:
         _LOGGER.error("飞牛NAS集成初始化失败: %s", str(e))
-        await coordinator.async_disconnect()
-        if hasattr(coordinator, '_ping_task') and coordinator._ping_task:
-            coordinator._ping_task.cancel()
+        # shield保证清理不被外部取消打断，超时防止SSH服务器无响应时卡死
+        try:
+            await asyncio.wait_for(asyncio.shield(coordinator.async_disconnect()), timeout=5)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("关闭SSH连接超时")
+        if coordinator._ping_task is not None:
+            await _async_cancel_task(coordinator._ping_task)
 
 async def async_update_entry(hass: HomeAssistant, entry: ConfigEntry):
     """更新配置项"""
-    # 卸载现有集成
-    await async_unload_entry(hass, entry)
-    # 重新加载集成
-    await async_setup_entry(hass, entry)
+    # 使用HA自带的重载机制，避免手动卸载/安装导致连接半关闭
+    await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """卸载集成"""
     # 获取集成数据
-    domain_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    domain_data = entry.runtime_data or {}
     unload_ok = True
     
     if DATA_UPDATE_COORDINATOR in domain_data:
@@ -80,18 +101,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
         
         if unload_ok:
-            # 关闭主协调器的SSH连接
-            await coordinator.async_disconnect()
-            
+            # 关闭主协调器的SSH连接（shield防止卸载任务被取消时泄漏连接）
+            try:
+                await asyncio.wait_for(asyncio.shield(coordinator.async_disconnect()), timeout=5)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("关闭SSH连接超时")
+
             # 关闭UPS协调器（如果存在）
             if ups_coordinator:
-                await ups_coordinator.async_shutdown()
+                try:
+                    await asyncio.wait_for(asyncio.shield(ups_coordinator.async_shutdown()), timeout=5)
+                except asyncio.TimeoutError:
+                    _LOGGER.warning("关闭UPS协调器超时")
             
-            # 取消监控任务（如果存在）
-            if hasattr(coordinator, '_ping_task') and coordinator._ping_task and not coordinator._ping_task.done():
-                coordinator._ping_task.cancel()
-                
-            # 从DOMAIN中移除该entry的数据
-            hass.data[DOMAIN].pop(entry.entry_id, None)
-    
+            # 取消监控任务（如果存在）并等待其结束
+            if coordinator._ping_task is not None:
+                await _async_cancel_task(coordinator._ping_task)
+
+
+            # 清除该entry的运行时数据
+            entry.runtime_data = None
+
     return unload_ok
\ No newline at end of file
@@ -1,4 +1,5 @@
 import logging
+from homeassistant.core import callback
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
@@ -7,28 +8,30 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# 健康状态集合，避免每次属性读取重复扫描列表
+_HEALTHY_STATES = frozenset({"正常", "良好", "OK", "ok", "good", "Good"})
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    domain_data = hass.data[DOMAIN][config_entry.entry_id]
+    domain_data = config_entry.runtime_data
     coordinator = domain_data[DATA_UPDATE_COORDINATOR]
     
+    eid = config_entry.entry_id
+
+    # 添加硬盘健康状态二元传感器（索引在async_delayed_setup中已预先整理好）
+    # 设备名本身唯一，uid必然唯一，无需额外的去重集合
     entities = []
-    existing_ids = set()
-    
-    # 添加硬盘健康状态二元传感器
-    for disk in coordinator.data.get("disks", []):
-        health_uid = f"{config_entry.entry_id}_{disk['device']}_health_binary"
-        if health_uid not in existing_ids:
-            entities.append(
-                DiskHealthBinarySensor(
-                    coordinator, 
-                    disk["device"], 
-                    f"硬盘 {disk.get('model', '未知')} 健康状态",
-                    health_uid,
-                    disk
-                )
+    for device, disk in config_entry.runtime_data["disks_by_device"].items():
+        health_uid = f"{eid}_{device}_health_binary"
+        entities.append(
+            DiskHealthBinarySensor(
+                coordinator,
+                device,
+                f"硬盘 {disk.get('model', '未知')} 健康状态",
+                health_uid,
+                disk
             )
-            existing_ids.add(health_uid)
-    
+        )
+
     async_add_entities(entities)
 
 
@@ -46,27 +49,21 @@ class DiskHealthBinarySensor(CoordinatorEntity, BinarySensorEntity):
             "via_device": (DOMAIN, DEVICE_ID_NAS)
         }
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-    
-    @property
-    def is_on(self):
-        """返回True表示有问题，False表示正常"""
-        for disk in self.coordinator.data.get("disks", []):
-            if disk["device"] == self.device_id:
-                health = disk.get("health", "未知")
-                # 将健康状态映射为二元状态
-                if health in ["正常", "良好", "OK", "ok", "good", "Good"]:
-                    return False  # 正常状态
-                elif health in ["警告", "异常", "错误", "warning", "Warning", "error", "Error", "bad", "Bad"]:
-                    return True   # 有问题状态
-                else:
-                    # 未知状态也视为有问题
-                    return True
-        return True  # 默认视为有问题
-    
-    @property
-    def icon(self):
-        """根据状态返回图标"""
-        if self.is_on:
-            return "mdi:alert-circle"  # 有问题时显示警告图标
+        self._update_state()
+
+    def _update_state(self):
+        """计算并缓存二元状态和图标，True表示有问题，False表示正常"""
+        disk = self.coordinator.data.get("disks_by_device", {}).get(self.device_id)
+        if disk is None:
+            self._attr_is_on = True  # 默认视为有问题
         else:
-            return "mdi:check-circle"   # 正常时显示对勾图标
\ No newline at end of file
+            # 健康状态为正常集合内的视为正常，其余（含未知）均视为有问题
+            self._attr_is_on = disk.get("health", "未知") not in _HEALTHY_STATES
+        # 有问题时显示警告图标，正常时显示对勾图标
+        self._attr_icon = "mdi:alert-circle" if self._attr_is_on else "mdi:check-circle"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """协调器更新时只计算一次状态"""
+        self._update_state()
+        super()._handle_coordinator_update()
\ No newline at end of file
@@ -1,4 +1,7 @@
 import logging
+import sys
+from types import MappingProxyType
+from homeassistant.core import callback
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -8,77 +11,107 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+__all__ = [
+    "async_setup_entry",
+    "RebootButton",
+    "VMRebootButton",
+    "VMDestroyButton",
+    "DockerContainerRestartButton",
+    "ZpoolScrubButton",
+]
+
+# 名称转安全ID的转换表（替换特殊字符）
+_SAFE_TRANS = str.maketrans({" ": "_", "/": "_", ".": "_"})
+
+# 内容固定的设备信息只构建一次，所有实体共享
+_NAS_DEVICE_INFO = MappingProxyType({
+    "identifiers": frozenset({(DOMAIN, DEVICE_ID_NAS)}),
+    "name": "飞牛NAS系统",
+    "manufacturer": "飞牛",
+    "model": "飞牛NAS"
+})
+_ZFS_DEVICE_INFO = MappingProxyType({
+    "identifiers": frozenset({(DOMAIN, DEVICE_ID_ZFS)}),
+    "name": "ZFS存储池",
+    "via_device": (DOMAIN, DEVICE_ID_NAS)
+})
+
+def _sub_device_info(identifier, name):
+    """生成挂在NAS下的子设备信息，仅标识符和名称随实体变化"""
+    return {
+        "identifiers": frozenset({(DOMAIN, identifier)}),
+        "name": name,
+        "via_device": (DOMAIN, DEVICE_ID_NAS)
+    }
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    domain_data = hass.data[DOMAIN][config_entry.entry_id]
+    domain_data = config_entry.runtime_data
     coordinator = domain_data[DATA_UPDATE_COORDINATOR]
     enable_docker = domain_data.get(CONF_ENABLE_DOCKER, False)
-    
-    entities = []
-    
-    # 1. 添加NAS重启按钮
-    entities.append(RebootButton(coordinator, config_entry.entry_id))
-    
-    # 2. 添加虚拟机重启按钮和强制关机按钮
-    if "vms" in coordinator.data:
-        for vm in coordinator.data["vms"]:
-            entities.append(
-                VMRebootButton(
-                    coordinator, 
-                    vm["name"],
-                    vm.get("title", vm["name"]),
-                    config_entry.entry_id
-                )
-            )
-            entities.append(
-                VMDestroyButton(
-                    coordinator, 
-                    vm["name"],
-                    vm.get("title", vm["name"]),
-                    config_entry.entry_id
-                )
-            )
-    
-    # 3. 添加Docker容器重启按钮（如果启用了Docker功能）
-    if enable_docker and "docker_containers" in coordinator.data:
-        for container in coordinator.data["docker_containers"]:
-            # 使用容器名称生成安全ID（替换特殊字符）
-            safe_name = container["name"].replace(" ", "_").replace("/", "_").replace(".", "_")
-            entities.append(
-                DockerContainerRestartButton(
-                    coordinator, 
-                    container["name"],
-                    safe_name,
-                    config_entry.entry_id
-                )
-            )
-    
-    # 4. 添加ZFS存储池scrub按钮
-    if "zpools" in coordinator.data:
-        for zpool in coordinator.data["zpools"]:
-            safe_name = zpool["name"].replace(" ", "_").replace("/", "_").replace(".", "_")
-            entities.append(
-                ZpoolScrubButton(
-                    coordinator, 
-                    zpool["name"],
-                    safe_name,
-                    config_entry.entry_id
-                )
+    entry_id = config_entry.entry_id
+    # 索引在async_delayed_setup中已预先整理好
+    runtime_data = config_entry.runtime_data
+    vms = runtime_data["vms_by_name"].values()
+
+    # unique_id前缀只格式化一次；intern让注册表按标识比较字符串
+    intern = sys.intern
+    vm_prefix = f"{entry_id}_flynas_vm_"
+    docker_prefix = f"{entry_id}_docker_"
+    zpool_prefix = f"{entry_id}_zpool_"
+
+    # 1. NAS重启按钮
+    entities = [RebootButton(coordinator, intern(f"{entry_id}_flynas_reboot"))]
+
+    # 2. 虚拟机重启按钮和强制关机按钮
+    entities += [
+        VMRebootButton(
+            coordinator, vm["name"], vm.get("title", vm["name"]),
+            intern(vm_prefix + vm["name"] + "_reboot")
+        )
+        for vm in vms
+    ]
+    entities += [
+        VMDestroyButton(
+            coordinator, vm["name"], vm.get("title", vm["name"]),
+            intern(vm_prefix + vm["name"] + "_destroy")
+        )
+        for vm in vms
+    ]
+
+    # 3. Docker容器重启按钮（如果启用了Docker功能）
+    if enable_docker:
+        entities += [
+            DockerContainerRestartButton(
+                coordinator,
+                container["name"],
+                safe_name,
+                intern(docker_prefix + safe_name + "_restart")
             )
-    
+            for container in runtime_data["containers_by_name"].values()
+            if (safe_name := container["name"].translate(_SAFE_TRANS))
+        ]
+
+    # 4. ZFS存储池scrub按钮
+    entities += [
+        ZpoolScrubButton(
+            coordinator,
+            zpool["name"],
+            safe_name,
+            intern(zpool_prefix + safe_name + "_scrub")
+        )
+        for zpool in runtime_data["zpools"]
+        if (safe_name := zpool["name"].translate(_SAFE_TRANS))
+    ]
+
     async_add_entities(entities)
 
 class RebootButton(CoordinatorEntity, ButtonEntity):
-    def __init__(self, coordinator, entry_id):
+    def __init__(self, coordinator, unique_id):
         super().__init__(coordinator)
         self._attr_name = "重启"
-        self._attr_unique_id = f"{entry_id}_flynas_reboot"
+        self._attr_unique_id = unique_id
         self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_NAS)},
-            "name": "飞牛NAS系统",
-            "manufacturer": "飞牛",
-            "model": "飞牛NAS"
-        }
+        self._attr_device_info = _NAS_DEVICE_INFO
     
     async def async_press(self):
         await self.coordinator.reboot_system()
@@ -91,17 +124,15 @@ class RebootButton(CoordinatorEntity, ButtonEntity):
         }
 
 class VMRebootButton(CoordinatorEntity, ButtonEntity):
-    def __init__(self, coordinator, vm_name, vm_title, entry_id):
+    def __init__(self, coordinator, vm_name, vm_title, unique_id):
         super().__init__(coordinator)
         self.vm_name = vm_name
         self.vm_title = vm_title
         self._attr_name = f"{vm_title} 重启"
-        self._attr_unique_id = f"{entry_id}_flynas_vm_{vm_name}_reboot"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"vm_{vm_name}")},
-            "name": vm_title,
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
+        self._attr_unique_id = unique_id
+        self._attr_device_info = _sub_device_info(f"vm_{vm_name}", vm_title)
+        # 乐观状态只挂在实体上，不污染coordinator.data
+        self._optimistic_state = None
 
         self.vm_manager = coordinator.vm_manager if hasattr(coordinator, 'vm_manager') else None
 
@@ -110,94 +141,103 @@ class VMRebootButton(CoordinatorEntity, ButtonEntity):
         if not self.vm_manager:
             _LOGGER.error("vm_manager不可用，无法重启虚拟机 %s", self.vm_name)
             return
-            
+
         try:
             success = await self.vm_manager.control_vm(self.vm_name, "reboot")
             if success:
-                # 更新状态为"重启中"
-                for vm in self.coordinator.data["vms"]:
-                    if vm["name"] == self.vm_name:
-                        vm["state"] = "rebooting"
+                # 乐观显示"重启中"，coordinator.data保持不变
+                self._optimistic_state = "rebooting"
                 self.async_write_ha_state()
-                
-                # 在下次更新时恢复实际状态
-                self.coordinator.async_add_listener(self.async_write_ha_state)
+
+                # CoordinatorEntity已订阅协调器，下次刷新时自动恢复实际状态
+                await self.coordinator.async_request_refresh()
         except Exception as e:
             _LOGGER.error("重启虚拟机时出错: %s", str(e), exc_info=True)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """新数据到达后丢弃乐观状态"""
+        self._optimistic_state = None
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self):
+        # 按下后到下轮刷新前，乐观状态通过属性暴露
+        if self._optimistic_state == "rebooting":
+            return {"操作状态": "重启中"}
+        return None
+
 class DockerContainerRestartButton(CoordinatorEntity, ButtonEntity):
-    def __init__(self, coordinator, container_name, safe_name, entry_id):
+    def __init__(self, coordinator, container_name, safe_name, unique_id):
         super().__init__(coordinator)
         self.container_name = container_name
         self.safe_name = safe_name
         self._attr_name = f"{container_name} 重启"
-        self._attr_unique_id = f"{entry_id}_docker_{safe_name}_restart"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"docker_{safe_name}")},
-            "name": container_name,
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
+        self._attr_unique_id = unique_id
+        self._attr_device_info = _sub_device_info(f"docker_{safe_name}", container_name)
         self._attr_icon = "mdi:docker"
+        # 乐观状态只挂在实体上，不污染coordinator.data
+        self._optimistic_status = None
 
     async def async_press(self):
         """重启Docker容器"""
-        # 检查是否启用了Docker功能
-        if not hasattr(self.coordinator, 'docker_manager') or self.coordinator.docker_manager is None:
+        # 检查是否启用了Docker功能（coordinator始终定义docker_manager，未启用时为None）
+        if self.coordinator.docker_manager is None:
             _LOGGER.error("Docker管理功能未启用，无法重启容器 %s", self.container_name)
             return
-            
+
         try:
-            # 更新状态为"重启中"
-            for container in self.coordinator.data.get("docker_containers", []):
-                if container["name"] == self.container_name:
-                    container["status"] = "restarting"
+            # 乐观显示"重启中"，coordinator.data保持不变
+            self._optimistic_status = "restarting"
             self.async_write_ha_state()
-            
+
             # 执行重启命令
             success = await self.coordinator.docker_manager.control_container(self.container_name, "restart")
-            
+
             if success:
                 _LOGGER.info("Docker容器 %s 重启命令已发送", self.container_name)
-                
+
                 # 强制刷新状态（因为容器重启可能需要时间）
-                self.coordinator.async_request_refresh()
+                await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("Docker容器 %s 重启失败", self.container_name)
-                # 恢复原始状态
-                for container in self.coordinator.data.get("docker_containers", []):
-                    if container["name"] == self.container_name:
-                        container["status"] = "running"  # 假设重启失败后状态不变
+                self._optimistic_status = None
                 self.async_write_ha_state()
-                
+
         except Exception as e:
             _LOGGER.error("重启Docker容器 %s 时出错: %s", self.container_name, str(e), exc_info=True)
-            # 恢复原始状态
-            for container in self.coordinator.data.get("docker_containers", []):
-                if container["name"] == self.container_name:
-                    container["status"] = "running"
+            self._optimistic_status = None
             self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """新数据到达后丢弃乐观状态"""
+        self._optimistic_status = None
+        super()._handle_coordinator_update()
     
     @property
     def extra_state_attributes(self):
-        return {
+        attrs = {
             "容器名称": self.container_name,
             "操作类型": "重启容器",
             "提示": "重启操作可能需要一些时间完成"
         }
+        # 按下后到下轮刷新前，乐观状态通过属性暴露
+        if self._optimistic_status == "restarting":
+            attrs["操作状态"] = "重启中"
+        return attrs
 
 class VMDestroyButton(CoordinatorEntity, ButtonEntity):
-    def __init__(self, coordinator, vm_name, vm_title, entry_id):
+    def __init__(self, coordinator, vm_name, vm_title, unique_id):
         super().__init__(coordinator)
         self.vm_name = vm_name
         self.vm_title = vm_title
         self._attr_name = f"{vm_title} 强制关机"
-        self._attr_unique_id = f"{entry_id}_flynas_vm_{vm_name}_destroy"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"vm_{vm_name}")},
-            "name": vm_title,
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
+        self._attr_unique_id = unique_id
+        self._attr_device_info = _sub_device_info(f"vm_{vm_name}", vm_title)
         self._attr_icon = "mdi:power-off"  # 使用关机图标
+        # 乐观状态只挂在实体上，不污染coordinator.data
+        self._optimistic_state = None
 
         self.vm_manager = coordinator.vm_manager if hasattr(coordinator, 'vm_manager') else None
 
@@ -206,49 +246,65 @@ class VMDestroyButton(CoordinatorEntity, ButtonEntity):
         if not self.vm_manager:
             _LOGGER.error("vm_manager不可用，无法强制关机虚拟机 %s", self.vm_name)
             return
-            
+
         try:
             success = await self.vm_manager.control_vm(self.vm_name, "destroy")
             if success:
-                # 更新状态为"强制关机中"
-                for vm in self.coordinator.data["vms"]:
-                    if vm["name"] == self.vm_name:
-                        vm["state"] = "destroying"
+                # 乐观显示"强制关机中"，coordinator.data保持不变
+                self._optimistic_state = "destroying"
                 self.async_write_ha_state()
-                
-                # 在下次更新时恢复实际状态
-                self.coordinator.async_add_listener(self.async_write_ha_state)
+
+                # CoordinatorEntity已订阅协调器，下次刷新时自动恢复实际状态
+                await self.coordinator.async_request_refresh()
         except Exception as e:
             _LOGGER.error("强制关机虚拟机时出错: %s", str(e), exc_info=True)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """新数据到达后丢弃乐观状态"""
+        self._optimistic_state = None
+        super()._handle_coordinator_update()
+
     @property
     def extra_state_attributes(self):
-        return {
+        attrs = {
             "虚拟机名称": self.vm_name,
             "操作类型": "强制关机",
             "警告": "此操作会强制关闭虚拟机，可能导致数据丢失",
             "提示": "仅在虚拟机无法正常关机时使用此功能"
         }
+        # 按下后到下轮刷新前，乐观状态通过属性暴露
+        if self._optimistic_state == "destroying":
+            attrs["操作状态"] = "强制关机中"
+        return attrs
 
 class ZpoolScrubButton(CoordinatorEntity, ButtonEntity):
-    def __init__(self, coordinator, zpool_name, safe_name, entry_id):
+    def __init__(self, coordinator, zpool_name, safe_name, unique_id):
         super().__init__(coordinator)
         self.zpool_name = zpool_name
         self.safe_name = safe_name
         self._attr_name = f"ZFS {zpool_name} 数据检查"
-        self._attr_unique_id = f"{entry_id}_zpool_{safe_name}_scrub"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_ZFS)},
-            "name": "ZFS存储池",
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
+        self._attr_unique_id = unique_id
+        self._attr_device_info = _ZFS_DEVICE_INFO
         self._attr_icon = "mdi:harddisk-check"
+        self._update_available()
 
-    @property
-    def available(self):
-        """检查按钮是否可用（当scrub进行中时不可点击）"""
+    def _update_available(self):
+        """缓存按钮可用状态（当scrub进行中时不可点击）"""
         scrub_status = self.coordinator.data.get("scrub_status", {}).get(self.zpool_name, {})
-        return not scrub_status.get("scrub_in_progress", False)
+        self._cached_available = not scrub_status.get("scrub_in_progress", False)
+
+    @property
+    def available(self) -> bool:
+        # CoordinatorEntity的available不看_attr_available，必须显式覆盖，
+        # 在协调器在线的前提下叠加scrub进行中的禁用逻辑
+        return super().available and self._cached_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """协调器更新时只计算一次可用状态"""
+        self._update_available()
+        super()._handle_coordinator_update()
 
     async def async_press(self):
         """执行ZFS存储池数据一致性检查"""
@@ -23,6 +23,45 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# 从ip link输出中提取 接口名+MAC 的正则，模块级预编译
+_MAC_LINE_RE = re.compile(r'^\d+: (\w+):.*\n\s+link/\w+\s+([0-9a-fA-F:]{17})', re.MULTILINE)
+
+# 用户步骤的表单结构固定，模块级构建一次
+_USER_STEP_SCHEMA = vol.Schema({
+    vol.Required(CONF_HOST): str,
+    vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+    vol.Required(CONF_USERNAME): str,
+    vol.Required(CONF_PASSWORD): str,
+    vol.Optional(
+        CONF_SCAN_INTERVAL, 
+        default=DEFAULT_SCAN_INTERVAL
+    ): int,
+    # 添加启用Docker的选项
+    vol.Optional(CONF_ENABLE_DOCKER, default=False): bool
+})
+
+def _build_options_schema(data):
+    """根据当前配置构建选项表单（默认值随配置变化，无法整体缓存）"""
+    return vol.Schema({
+        vol.Optional(
+            CONF_IGNORE_DISKS,
+            default=data.get(CONF_IGNORE_DISKS, "")
+        ): str,
+        vol.Optional(
+            CONF_FAN_CONFIG_PATH,
+            default=data.get(CONF_FAN_CONFIG_PATH, "")
+        ): str,
+        vol.Optional(
+            CONF_UPS_SCAN_INTERVAL,
+            default=data.get(CONF_UPS_SCAN_INTERVAL, DEFAULT_UPS_SCAN_INTERVAL)
+        ): int,
+        # 在选项流程中也添加启用Docker的选项
+        vol.Optional(
+            CONF_ENABLE_DOCKER,
+            default=data.get(CONF_ENABLE_DOCKER, False)
+        ): bool
+    })
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """处理飞牛NAS的配置流程"""
     
@@ -31,6 +70,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         super().__init__()
         self.ssh_config = None
+        # 同一流程内网卡列表不会变化，首次获取后缓存，表单重渲染不再连SSH
+        self._mac_options_cache = None
     
     async def async_step_user(self, user_input=None):
         errors = {}
@@ -61,37 +102,32 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Connection test failed: %s", str(e), exc_info=True)
                 errors["base"] = "unknown_error"
         
-        schema = vol.Schema({
-            vol.Required(CONF_HOST): str,
-            vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-            vol.Required(CONF_USERNAME): str,
-            vol.Required(CONF_PASSWORD): str,
-            vol.Optional(
-                CONF_SCAN_INTERVAL, 
-                default=DEFAULT_SCAN_INTERVAL
-            ): int,
-            # 添加启用Docker的选项
-            vol.Optional(CONF_ENABLE_DOCKER, default=False): bool
-        })
-        
         return self.async_show_form(
             step_id="user", 
-            data_schema=schema, 
+            data_schema=_USER_STEP_SCHEMA, 
             errors=errors
         )
     
     async def async_step_select_mac(self, user_input=None):
         """在添加集成时选择MAC地址"""
         errors = {}
-        mac_options = {}
+        mac_options = self._mac_options_cache or {}
 
-        try:
-            conn = await self.create_ssh_connection(self.ssh_config)
-            result = await conn.run("ip link show", timeout=5)
-            mac_options = self.parse_mac_addresses(result.stdout)
-        except Exception as e:
-            errors["base"] = f"获取网卡信息失败: {str(e)}"
-            _LOGGER.error("获取网卡信息失败: %s", str(e), exc_info=True)
+        if not mac_options:
+            conn = None
+            try:
+                conn = await self.create_ssh_connection(self.ssh_config)
+                result = await conn.run("ip link show", timeout=5)
+                mac_options = self.parse_mac_addresses(result.stdout)
+                if mac_options:
+                    self._mac_options_cache = mac_options
+            except Exception as e:
+                errors["base"] = f"获取网卡信息失败: {str(e)}"
+                _LOGGER.error("获取网卡信息失败: %s", str(e), exc_info=True)
+            finally:
+                # 临时连接用完即关，避免泄漏
+                if conn and not conn.is_closed():
+                    conn.close()
 
         if not mac_options:
             errors["base"] = "未找到网卡MAC地址"
@@ -126,16 +162,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def parse_mac_addresses(self, output: str) -> dict:
         """从ip link命令输出中解析MAC地址"""
-        mac_options = {}
-        pattern = re.compile(r'^\d+: (\w+):.*\n\s+link/\w+\s+([0-9a-fA-F:]{17})', re.MULTILINE)
-        matches = pattern.findall(output)
-        
-        for interface, mac in matches:
-            if interface == "lo" or mac == "00:00:00:00:00:00":
-                continue
-            mac_options[mac] = f"{interface} - {mac}"
-        
-        return mac_options
+        return {
+            mac: f"{interface} - {mac}"
+            for interface, mac in _MAC_LINE_RE.findall(output)
+            if interface != "lo" and mac != "00:00:00:00:00:00"
+        }
     
     async def create_ssh_connection(self, config):
         host = config[CONF_HOST]
@@ -199,26 +230,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
         
         data = self.config_entry.options or self.config_entry.data
-        
-        options = vol.Schema({
-            vol.Optional(
-                CONF_IGNORE_DISKS,
-                default=data.get(CONF_IGNORE_DISKS, "")
-            ): str,
-            vol.Optional(
-                CONF_FAN_CONFIG_PATH,
-                default=data.get(CONF_FAN_CONFIG_PATH, "")
-            ): str,
-            vol.Optional(
-                CONF_UPS_SCAN_INTERVAL,
-                default=data.get(CONF_UPS_SCAN_INTERVAL, DEFAULT_UPS_SCAN_INTERVAL)
-            ): int,
-            # 在选项流程中也添加启用Docker的选项
-            vol.Optional(
-                CONF_ENABLE_DOCKER,
-                default=data.get(CONF_ENABLE_DOCKER, False)
-            ): bool
-        })
+        options = _build_options_schema(data)
         
         return self.async_show_form(
             step_id="init",
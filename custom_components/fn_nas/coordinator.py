@@ -2,6 +2,8 @@ import logging
 import asyncio
 import asyncssh
 import re
+import shlex
+import uuid
 from datetime import timedelta
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -20,6 +22,12 @@ from .docker_manager import DockerManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# 批量命令输出的分段标记
+_BATCH_SEP = "###FN_SEP###"
+
+# sudo命令前缀，避免每条命令重复格式化
+_SUDO_PREFIX = "sudo -S -p '' "
+
 class FlynasCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, config, config_entry) -> None:
         self.config = config
@@ -35,13 +43,22 @@ class FlynasCoordinator(DataUpdateCoordinator):
         self.docker_manager = DockerManager(self) if self.enable_docker else None
         self.ssh = None
         self.ssh_closed = True
-        # SSH连接池管理
-        self.ssh_pool = []
-        self.ssh_pool_size = 3  # 连接池大小
-        self.ssh_pool_lock = asyncio.Lock()
+        # 单条SSH连接多路复用：一次握手后并发命令各开一个会话通道
+        self.max_sessions = 8  # 单连接上的最大并发会话数
+        self._shared_ssh = None
+        # 懒启动的SFTP客户端及其所属连接，用于免shell读取小文件
+        self._sftp = None
+        self._sftp_conn = None
+        self._session_sem = asyncio.Semaphore(self.max_sessions)
+        self.ssh_pool_lock = asyncio.Lock()  # 保护共享连接的创建/重建
         self.ups_manager = UPSManager(self)
         self.vm_manager = VMManager(self)
         self.use_sudo = False
+        # sudo密码输入只拼接一次，后续每条命令直接复用
+        sudo_pw = self.root_password if self.root_password else self.password
+        self._sudo_input = (sudo_pw + "\n") if sudo_pw else None
+        # 权限模式是用户属性而非连接属性，探测一次后重建连接直接复用
+        self._permissions_resolved = False
         
         # 确保data始终有初始值
         self.data = self.get_default_data()
@@ -53,9 +70,10 @@ class FlynasCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=update_interval
+            update_interval=update_interval,
+            always_update=False
         )
-        
+
         self.disk_manager = DiskManager(self)
         self.system_manager = SystemManager(self)
         self._system_online = False
@@ -64,13 +82,11 @@ class FlynasCoordinator(DataUpdateCoordinator):
         self._last_command_time = 0
         self._command_count = 0
     
-        # 添加日志方法
-        self.debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
-    
     def get_default_data(self):
         """返回默认的数据结构"""
         return {
             "disks": [],
+            "disks_by_device": {},
             "system": {
                 "uptime": "未知",
                 "cpu_temperature": "未知",
@@ -79,166 +95,128 @@ class FlynasCoordinator(DataUpdateCoordinator):
             },
             "ups": {},
             "vms": [],
+            "vms_by_name": {},
             "docker_containers": [],
+            "containers_by_name": {},
             "zpools": [],
             "scrub_status": {}
         }
     
-    def _debug_log(self, message: str):
-        """只在调试模式下输出详细日志"""
-        if self.debug_enabled:
-            _LOGGER.debug(message)
-
-    def _info_log(self, message: str):
-        """重要信息日志"""
-        _LOGGER.info(message)
-
-    def _warning_log(self, message: str):
-        """警告日志"""
-        _LOGGER.warning(message)
-
-    def _error_log(self, message: str):
-        """错误日志"""
-        _LOGGER.error(message)
-
     async def get_ssh_connection(self):
-        """从连接池获取可用的SSH连接"""
-        async with self.ssh_pool_lock:
-            # 检查现有连接
-            for i, (ssh, in_use) in enumerate(self.ssh_pool):
-                if not in_use:
-                    try:
-                        # 测试连接是否活跃
-                        await asyncio.wait_for(ssh.run("echo 'test'", timeout=1), timeout=2)
-                        self.ssh_pool[i] = (ssh, True)  # 标记为使用中
-                        self._debug_log(f"复用连接池中的连接 {i}")
-                        return ssh, i
-                    except Exception:
-                        # 连接失效，移除
-                        try:
-                            ssh.close()
-                        except:
-                            pass
-                        self.ssh_pool.pop(i)
-                        break
-            
-            # 如果连接池未满，创建新连接
-            if len(self.ssh_pool) < self.ssh_pool_size:
-                try:
-                    ssh = await asyncssh.connect(
+        """获取共享SSH连接上的一个会话配额"""
+        await self._session_sem.acquire()
+        try:
+            async with self.ssh_pool_lock:
+                if self._shared_ssh is None or self._shared_ssh.is_closed():
+                    self._shared_ssh = await asyncssh.connect(
                         self.host,
                         port=self.port,
                         username=self.username,
                         password=self.password,
                         known_hosts=None,
-                        connect_timeout=5
+                        connect_timeout=5,
+                        keepalive_interval=15,
+                        keepalive_count_max=3
                     )
-                    
+
                     # 检查并设置权限状态
-                    await self._setup_connection_permissions(ssh)
-                    
-                    connection_id = len(self.ssh_pool)
-                    self.ssh_pool.append((ssh, True))
-                    self._debug_log(f"创建新的SSH连接 {connection_id}")
-                    return ssh, connection_id
-                except Exception as e:
-                    self._debug_log(f"创建SSH连接失败: {e}")
-                    raise
-            
-            # 连接池满且所有连接都在使用中，等待可用连接
-            self._debug_log("所有连接都在使用中，等待可用连接...")
-            for _ in range(50):  # 最多等待5秒
-                await asyncio.sleep(0.1)
-                for i, (ssh, in_use) in enumerate(self.ssh_pool):
-                    if not in_use:
-                        try:
-                            await asyncio.wait_for(ssh.run("echo 'test'", timeout=1), timeout=2)
-                            self.ssh_pool[i] = (ssh, True)
-                            self._debug_log(f"等待后获得连接 {i}")
-                            return ssh, i
-                        except Exception:
-                            try:
-                                ssh.close()
-                            except:
-                                pass
-                            self.ssh_pool.pop(i)
-                            break
-            
-            raise Exception("无法获取SSH连接")
+                    await self._setup_connection_permissions(self._shared_ssh)
+                    _LOGGER.debug("建立共享SSH连接")
+            return self._shared_ssh
+        except Exception as e:
+            self._session_sem.release()
+            _LOGGER.debug("创建SSH连接失败: %s", e)
+            raise
 
     async def _setup_connection_permissions(self, ssh):
-        """为新连接设置权限状态"""
+        """为新连接设置权限状态（全部探测合并为一次远端调用）"""
+        # 已经探测过的话直接复用结论，重建连接不再往返探测
+        if self._permissions_resolved:
+            return
+
+        # 先一次往返拿到uid和免密sudo结果；需要密码时再逐个密码单独探测，
+        # 各自用独立的stdin，避免sudo重试把下一个候选密码也吃掉
         try:
-            # 检查是否为root用户
-            result = await ssh.run("id -u", timeout=3)
-            if result.stdout.strip() == "0":
-                self._debug_log("当前用户是 root")
+            result = await ssh.run(
+                f"id -u; echo '{_BATCH_SEP}'; sudo -n whoami 2>/dev/null",
+                timeout=8
+            )
+            parts = [p.strip() for p in result.stdout.split(_BATCH_SEP)]
+            parts += [""] * (2 - len(parts))
+            uid, nopass_sudo = parts[:2]
+
+            self._permissions_resolved = True
+
+            if uid == "0":
+                # 只有真正以root登录时才可以不走sudo
+                _LOGGER.debug("当前用户是 root")
                 self.use_sudo = False
                 return
-            
-            # 尝试切换到root会话
-            if self.root_password:
-                try:
-                    await ssh.run(
-                        f"echo '{self.root_password}' | sudo -S -i",
-                        input=self.root_password + "\n",
-                        timeout=5
-                    )
-                    whoami = await ssh.run("whoami")
-                    if "root" in whoami.stdout:
-                        self._info_log("成功切换到 root 会话（使用 root 密码）")
-                        self.use_sudo = False
-                        return
-                except Exception:
-                    pass
-            
-            # 尝试使用登录密码sudo
-            try:
-                await ssh.run(
-                    f"echo '{self.password}' | sudo -S -i",
-                    input=self.password + "\n",
-                    timeout=5
+
+            self.use_sudo = True
+
+            if "root" in nopass_sudo:
+                # 免密sudo可用，命令直接加sudo前缀，不需要喂密码
+                _LOGGER.info("sudo免密可用")
+                self._sudo_input = None
+                return
+
+            # 逐个候选密码探测，-k忽略缓存凭据保证测的是这个密码本身
+            for password, label in (
+                (self.root_password, "root 密码"),
+                (self.password, "登录密码"),
+            ):
+                if not password:
+                    continue
+                probe = await ssh.run(
+                    "sudo -S -p '' -k whoami 2>/dev/null",
+                    input=password + "\n",
+                    timeout=8
                 )
-                whoami = await ssh.run("whoami")
-                if "root" in whoami.stdout:
-                    self._info_log("成功切换到 root 会话（使用登录密码）")
-                    self.use_sudo = False
+                if "root" in probe.stdout:
+                    _LOGGER.info("sudo提权可用（使用%s）", label)
+                    self._sudo_input = password + "\n"
                     return
-            except Exception:
-                pass
-                
-            # 设置为使用sudo模式
-            self.use_sudo = True
-            self._debug_log("设置为使用sudo模式")
-            
+
+            # 没有密码通过探测，保留初始化时的候选密码尽力而为
+            _LOGGER.warning("sudo密码探测均未成功，命令可能因权限不足失败")
+
         except Exception as e:
-            self._debug_log(f"设置连接权限失败: {e}")
+            _LOGGER.debug("设置连接权限失败: %s", e)
             self.use_sudo = True
 
-    async def release_ssh_connection(self, connection_id):
-        """释放SSH连接回连接池"""
-        async with self.ssh_pool_lock:
-            if 0 <= connection_id < len(self.ssh_pool):
-                ssh, _ = self.ssh_pool[connection_id]
-                self.ssh_pool[connection_id] = (ssh, False)  # 标记为可用
-                self._debug_log(f"释放SSH连接 {connection_id}")
-    
+    async def release_ssh_connection(self, ssh):
+        """归还会话配额"""
+        self._session_sem.release()
+
+    def _discard_connection(self, ssh):
+        """命令执行报连接级错误时，关闭共享连接，下次获取时重建"""
+        if ssh is self._shared_ssh:
+            self._shared_ssh = None
+        try:
+            ssh.close()
+        except:
+            pass
+
     async def close_all_ssh_connections(self):
-        """关闭所有SSH连接"""
+        """关闭共享SSH连接"""
+        # 没有连接时直接返回，不必拿锁
+        if self._shared_ssh is None:
+            return
         async with self.ssh_pool_lock:
-            for ssh, _ in self.ssh_pool:
+            if self._shared_ssh is not None:
                 try:
-                    ssh.close()
+                    self._shared_ssh.close()
                 except:
                     pass
-            self.ssh_pool.clear()
-            self._debug_log("已关闭所有SSH连接")
-    
+                self._shared_ssh = None
+            _LOGGER.debug("已关闭SSH连接")
+
     async def async_connect(self):
         """建立并保持持久SSH连接 - 兼容旧代码"""
         try:
-            ssh, connection_id = await self.get_ssh_connection()
-            await self.release_ssh_connection(connection_id)
+            ssh = await self.get_ssh_connection()
+            await self.release_ssh_connection(ssh)
             return True
         except Exception:
             return False
@@ -248,94 +226,148 @@ class FlynasCoordinator(DataUpdateCoordinator):
         await self.close_all_ssh_connections()
     
     async def run_command(self, command: str, retries=2) -> str:
-        """执行SSH命令，使用连接池"""
+        """执行SSH命令，使用连接池；连接级错误时换新连接重试"""
         # 系统离线时直接返回空字符串
         if not self._system_online:
             return ""
-        
+
+        for attempt in range(retries):
+            ssh = None
+            try:
+                # 从连接池获取连接
+                ssh = await self.get_ssh_connection()
+
+                # 构建完整命令，sudo密码通过stdin传入，不经过命令行
+                if self.use_sudo:
+                    if self._sudo_input is not None:
+                        result = await ssh.run(
+                            _SUDO_PREFIX + command,
+                            input=self._sudo_input,
+                            timeout=10
+                        )
+                    else:
+                        result = await ssh.run(f"sudo {command}", timeout=10)
+                else:
+                    result = await ssh.run(command, timeout=10)
+
+                return result.stdout.strip()
+
+            except (asyncssh.ConnectionLost, asyncssh.ChannelOpenError) as e:
+                # 连接已失效，淘汰后用新连接重试
+                _LOGGER.debug("连接失效，重试命令: %s, 错误: %s", command, e)
+                if ssh is not None:
+                    self._discard_connection(ssh)
+
+            except Exception as e:
+                _LOGGER.debug("命令执行失败: %s, 错误: %s", command, e)
+                return ""
+
+            finally:
+                # 释放连接回连接池
+                if ssh is not None:
+                    await self.release_ssh_connection(ssh)
+
+        return ""
+    
+    async def run_commands_batch(self, commands: list[str]) -> list[str]:
+        """把多条命令合并为一次SSH往返执行，返回与输入一一对应的输出列表"""
+        if not commands:
+            return []
+
+        # 每次调用生成唯一分隔符，防止命令输出里恰好含有固定哨兵串导致错位
+        sep = f"###FN_SEP_{uuid.uuid4().hex}###"
+        joined = f"; echo '{sep}'; ".join(commands)
+        # 包在sh -c里整体执行，sudo模式下提权对整个批次生效
+        output = await self.run_command("sh -c " + shlex.quote(joined))
+        if not output:
+            return [""] * len(commands)
+
+        parts = [part.strip() for part in output.split(sep)]
+        # 某条命令失败导致分段不足时补空串对齐
+        parts += [""] * (len(commands) - len(parts))
+        return parts[:len(commands)]
+
+    async def read_small_file(self, path: str) -> str:
+        """通过共享连接的SFTP子系统直接读取小文件
+
+        跳过远端 sh -c + cat 的fork/exec，适合/proc下的小文件；
+        SFTP不可用时退回cat。
+        """
+        if not self._system_online:
+            return ""
+
         ssh = None
-        connection_id = None
-        
         try:
-            # 从连接池获取连接
-            ssh, connection_id = await self.get_ssh_connection()
-            
-            # 构建完整命令
-            if self.use_sudo:
-                if self.root_password or self.password:
-                    password = self.root_password if self.root_password else self.password
-                    full_command = f"sudo -S {command}"
-                    result = await ssh.run(full_command, input=password + "\n", timeout=10)
-                else:
-                    full_command = f"sudo {command}"
-                    result = await ssh.run(full_command, timeout=10)
-            else:
-                result = await ssh.run(command, timeout=10)
-            
-            return result.stdout.strip()
-        
+            ssh = await self.get_ssh_connection()
+            # SFTP客户端绑定在连接上，连接重建后要重新启动
+            if self._sftp is None or self._sftp_conn is not ssh:
+                self._sftp = await ssh.start_sftp_client()
+                self._sftp_conn = ssh
+            async with self._sftp.open(path) as f:
+                return await f.read()
         except Exception as e:
-            self._debug_log(f"命令执行失败: {command}, 错误: {str(e)}")
-            return ""
-        
+            _LOGGER.debug("SFTP读取%s失败，退回cat: %s", path, e)
+            self._sftp = None
+            self._sftp_conn = None
         finally:
-            # 释放连接回连接池
-            if connection_id is not None:
-                await self.release_ssh_connection(connection_id)
-    
+            if ssh is not None:
+                await self.release_ssh_connection(ssh)
+
+        # 会话配额已归还，这里再走普通命令通道不会叠加占用
+        return await self.run_command(f"cat {path}")
+
     async def run_command_direct(self, command: str) -> str:
         """直接执行命令，获取独立连接 - 用于并发任务"""
         if not self._system_online:
             return ""
         
         ssh = None
-        connection_id = None
-        
+
         try:
-            ssh, connection_id = await self.get_ssh_connection()
-            
+            ssh = await self.get_ssh_connection()
+
             if self.use_sudo:
-                if self.root_password or self.password:
-                    password = self.root_password if self.root_password else self.password
-                    full_command = f"sudo -S {command}"
-                    result = await ssh.run(full_command, input=password + "\n", timeout=10)
+                if self._sudo_input is not None:
+                    result = await ssh.run(
+                        _SUDO_PREFIX + command,
+                        input=self._sudo_input,
+                        timeout=10
+                    )
                 else:
-                    full_command = f"sudo {command}"
-                    result = await ssh.run(full_command, timeout=10)
+                    result = await ssh.run(f"sudo {command}", timeout=10)
             else:
                 result = await ssh.run(command, timeout=10)
             
             return result.stdout.strip()
         
         except Exception as e:
-            self._debug_log(f"直接命令执行失败: {command}, 错误: {str(e)}")
+            _LOGGER.debug("直接命令执行失败: %s, 错误: %s", command, e)
             return ""
-        
+
         finally:
-            if connection_id is not None:
-                await self.release_ssh_connection(connection_id)
+            if ssh is not None:
+                await self.release_ssh_connection(ssh)
     
     async def ping_system(self) -> bool:
-        """轻量级系统状态检测"""
-        # 对于本地主机直接返回True
-        if self.host in ['localhost', '127.0.0.1']:
-            return True
-            
+        """轻量级系统状态检测：直接对SSH端口做TCP连接探测
+
+        相比fork一个ping子进程，一次SYN/ACK开销更小，且ICMP被防火墙
+        拦截而SSH可用时不会误判离线。
+        """
         try:
-            # 使用异步ping检测，减少超时时间
-            proc = await asyncio.create_subprocess_exec(
-                'ping', '-c', '1', '-W', '1', self.host,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=1.5
             )
-            await asyncio.wait_for(proc.wait(), timeout=2)  # 总超时时间2秒
-            return proc.returncode == 0
+            writer.close()
+            await writer.wait_closed()
+            return True
         except Exception:
             return False
     
     async def _monitor_system_status(self):
         """系统离线时轮询检测状态"""
-        self._debug_log(f"启动系统状态监控，每{self._retry_interval}秒检测一次")
+        _LOGGER.debug("启动系统状态监控，每%s秒检测一次", self._retry_interval)
         
         # 使用指数退避策略，避免频繁检测
         check_interval = self._retry_interval
@@ -345,7 +377,7 @@ class FlynasCoordinator(DataUpdateCoordinator):
             await asyncio.sleep(check_interval)
             
             if await self.ping_system():
-                self._info_log("检测到系统已开机，触发重新加载")
+                _LOGGER.info("检测到系统已开机，触发重新加载")
                 # 触发集成重新加载
                 self.hass.async_create_task(
                     self.hass.config_entries.async_reload(self.config_entry.entry_id)
@@ -354,92 +386,96 @@ class FlynasCoordinator(DataUpdateCoordinator):
             else:
                 # 系统仍然离线，增加检测间隔（指数退避）
                 check_interval = min(check_interval * 1.5, max_interval)
-                self._debug_log(f"系统仍离线，下次检测间隔: {check_interval}秒")
+                _LOGGER.debug("系统仍离线，下次检测间隔: %s秒", check_interval)
     
+    async def _get_docker_containers(self):
+        """获取Docker容器信息，未启用时返回空列表"""
+        if not (self.enable_docker and self.docker_manager):
+            return []
+        try:
+            return await self.docker_manager.get_containers()
+        except Exception as e:
+            _LOGGER.debug("Docker信息获取失败: %s", e)
+            return []
+
     async def _async_update_data(self):
         """数据更新入口，优化命令执行频率"""
-        self._debug_log("开始数据更新...")
+        _LOGGER.debug("开始数据更新...")
         is_online = await self.ping_system()
+        was_online = self._system_online
         self._system_online = is_online
         
         if not is_online:
-            self._debug_log("系统离线，跳过数据更新")
+            _LOGGER.debug("系统离线，跳过数据更新")
             # 启动后台监控任务
             if not self._ping_task or self._ping_task.done():
                 self._ping_task = asyncio.create_task(self._monitor_system_status())
-            await self.close_all_ssh_connections()
+            # 只在在线转离线的那一刻关闭连接，持续离线期间无事可做
+            if was_online:
+                await self.close_all_ssh_connections()
             return self.get_default_data()
         
         # 系统在线处理
         try:
-            # 预热连接池并确保权限设置正确
-            await self.async_connect()
-            
-            # 获取系统状态信息
+            # 连接按需懒建立，keepalive负责剔除死连接，无需每轮预热
             status = "on"
             
-            # 串行获取信息以确保稳定性
-            self._debug_log("开始获取系统信息...")
-            system = await self.system_manager.get_system_info()
-            self._debug_log("系统信息获取完成")
-            
-            self._debug_log("开始获取磁盘信息...")
-            disks = await self.disk_manager.get_disks_info()
-            self._debug_log(f"磁盘信息获取完成，数量: {len(disks)}")
-            
-            self._debug_log("开始获取ZFS存储池信息...")
-            zpools = await self.disk_manager.get_zpools()
-            self._debug_log(f"ZFS存储池信息获取完成，数量: {len(zpools)}")
+            # 并发获取六类信息，会话信号量限制同时打开的通道数
+            _LOGGER.debug("开始并发获取系统/磁盘/存储池/UPS/虚拟机/Docker信息...")
+            system, disks, zpools, ups_info, vms, docker_containers = await asyncio.gather(
+                self.system_manager.get_system_info(),
+                self.disk_manager.get_disks_info(),
+                self.disk_manager.get_zpools(),
+                self.ups_manager.get_ups_info(),
+                self.vm_manager.get_vm_list(),
+                self._get_docker_containers()
+            )
+            _LOGGER.debug(
+                "基础信息获取完成: disks=%d, zpools=%d, vms=%d",
+                len(disks), len(zpools), len(vms)
+            )
             
-            # 获取所有ZFS存储池的scrub状态
+            # 一次zpool status调用获取全部存储池的scrub状态
             scrub_status = {}
-            for zpool in zpools:
-                self._debug_log(f"开始获取存储池 {zpool['name']} 的scrub状态...")
-                scrub_info = await self.disk_manager.get_zpool_status(zpool['name'])
-                scrub_status[zpool['name']] = scrub_info
-                self._debug_log(f"存储池 {zpool['name']} scrub状态获取完成")
-            
-            self._debug_log("开始获取UPS信息...")
-            ups_info = await self.ups_manager.get_ups_info()
-            self._debug_log("UPS信息获取完成")
-            
-            self._debug_log("开始获取虚拟机信息...")
-            vms = await self.vm_manager.get_vm_list()
-            self._debug_log(f"虚拟机信息获取完成，数量: {len(vms)}")
+            if zpools:
+                scrub_status = await self.disk_manager.get_zpool_status(
+                    [z['name'] for z in zpools]
+                )
             
-            # 为每个虚拟机获取标题
-            for vm in vms:
-                try:
-                    vm["title"] = await self.vm_manager.get_vm_title(vm["name"])
-                except Exception as e:
-                    self._debug_log(f"获取VM标题失败 {vm['name']}: {e}")
-                    vm["title"] = vm["name"]
-            
-            # 获取Docker容器信息
-            docker_containers = []
-            if self.enable_docker and self.docker_manager:
-                self._debug_log("开始获取Docker信息...")
-                try:
-                    docker_containers = await self.docker_manager.get_containers()
-                    self._debug_log(f"Docker信息获取完成，数量: {len(docker_containers)}")
-                except Exception as e:
-                    self._debug_log(f"Docker信息获取失败: {e}")
+            # 一次virsh调用取回全部虚拟机标题，循环内只做本地字典查找
+            if vms:
+                titles = await self.vm_manager.get_all_titles()
+                for vm in vms:
+                    vm["title"] = titles.get(vm["name"], vm["name"])
             
+            # 按名称排序，保证数据结构稳定，always_update=False时可正确比较
+            disks.sort(key=lambda d: d.get("device", ""))
+            vms.sort(key=lambda v: v.get("name", ""))
+            docker_containers.sort(key=lambda c: c.get("name", ""))
+            zpools.sort(key=lambda z: z.get("name", ""))
+
             data = {
                 "disks": disks,
+                # 设备名索引，实体查询时O(1)定位
+                "disks_by_device": {d["device"]: d for d in disks},
                 "system": {**system, "status": status},
                 "ups": ups_info,
                 "vms": vms,
+                "vms_by_name": {v["name"]: v for v in vms},
                 "docker_containers": docker_containers,
+                "containers_by_name": {c["name"]: c for c in docker_containers},
                 "zpools": zpools,
                 "scrub_status": scrub_status
             }
             
-            self._debug_log(f"数据更新完成: disks={len(disks)}, vms={len(vms)}, containers={len(docker_containers)}")
+            _LOGGER.debug(
+                "数据更新完成: disks=%d, vms=%d, containers=%d",
+                len(disks), len(vms), len(docker_containers)
+            )
             return data
         
         except Exception as e:
-            self._error_log(f"数据更新失败: {str(e)}")
+            _LOGGER.error("数据更新失败: %s", e)
             self._system_online = False
             if not self._ping_task or self._ping_task.done():
                 self._ping_task = asyncio.create_task(self._monitor_system_status())
@@ -457,12 +493,12 @@ class FlynasCoordinator(DataUpdateCoordinator):
     async def scrub_zpool(self, pool_name: str) -> bool:
         """执行ZFS存储池数据一致性检查"""
         try:
-            self._debug_log(f"开始对ZFS存储池 {pool_name} 执行scrub操作")
+            _LOGGER.debug("开始对ZFS存储池 %s 执行scrub操作", pool_name)
             command = f"zpool scrub {pool_name}"
             result = await self.run_command(command)
             
             if result and not result.lower().startswith("cannot"):
-                self._debug_log(f"ZFS存储池 {pool_name} scrub操作启动成功")
+                _LOGGER.debug("ZFS存储池 %s scrub操作启动成功", pool_name)
                 return True
             else:
                 self.logger.error(f"ZFS存储池 {pool_name} scrub操作失败: {result}")
@@ -476,7 +512,7 @@ class UPSDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, config, main_coordinator):
         self.config = config
         self.main_coordinator = main_coordinator
-        
+
         ups_scan_interval = config.get(CONF_UPS_SCAN_INTERVAL, DEFAULT_UPS_SCAN_INTERVAL)
         update_interval = timedelta(seconds=ups_scan_interval)
         
@@ -484,8 +520,13 @@ class UPSDataUpdateCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name="UPS Data",
-            update_interval=update_interval
+            update_interval=update_interval,
+            always_update=False
         )
+
+        # 首次刷新在后台执行，data要在刷新完成前可安全访问；
+        # 基类__init__会把data重置为None，所以必须在super().__init__()之后赋值
+        self.data = {}
         
         self.ups_manager = UPSManager(main_coordinator)
     
@@ -1,30 +1,124 @@
 import re
 import logging
 import asyncio
+from functools import lru_cache
 from .const import CONF_IGNORE_DISKS
 
 _LOGGER = logging.getLogger(__name__)
 
+# 模式全部模块级预编译，避免每块磁盘每轮重复解析正则
+_CAPACITY_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([KMGT]?B|bytes?)', re.IGNORECASE)
+
+# 单位到字节倍率的查表，替代if/elif阶梯
+_UNIT_MULTIPLIER = {
+    'B': 1, 'BYTE': 1, 'BYTES': 1,
+    'KB': 1024, 'KIB': 1024,
+    'MB': 1024**2, 'MIB': 1024**2,
+    'GB': 1024**3, 'GIB': 1024**3,
+    'TB': 1024**4, 'TIB': 1024**4
+}
+_CAP_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 温度检测：七种格式融合为一条带命名分组的交替式，正则只需扫描一遍
+_TEMP_FUSED_RE = re.compile(
+    r"(?:Temperature:\s*(?P<nvme>\d+)\s*Celsius)"      # NVMe 格式
+    r"|(?:Composite:\s*\+?(?P<comp>\d+\.?\d*)°C)"      # NVMe 复合温度
+    r"|(?:194\s+Temperature_Celsius\s+.*?(?P<a194>\d+))"  # 属性194行
+    r"|(?:\bTemperature_Celsius\b.*?(?P<gen>\d+)\b)"
+    r"|(?:Current Temperature:\s*(?P<cur>\d+))"
+    r"|(?:Airflow_Temperature_Cel\b.*?(?P<air>\d+)\b)"
+    r"|(?:Temp\s*[=:]\s*(?P<temp>\d+))",
+    re.IGNORECASE | re.MULTILINE
+)
+_TEMP194_PRIMARY_RE = re.compile(
+    r"194\s+Temperature_Celsius\s+.*?(\d+)\s*(?:\(|$)", re.IGNORECASE | re.MULTILINE
+)
+# 属性194温度历史（Celsius后接\b而非误写的+，值取行尾括号内的数字串）
+_TEMP194_HISTORY_RE = re.compile(
+    r"^\s*194\s+Temperature_Celsius\b.*?\(\s*([\d\s]+?)\)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+
+# NVMe通电时间模式（支持带逗号的数字格式）
+_NVME_POH_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Power On Hours\s*:\s*([\d,]+)",
+    r"Power On Time\s*:\s*([\d,]+)",
+    r"Power on hours\s*:\s*([\d,]+)",
+    r"Power on time\s*:\s*([\d,]+)"
+))
+_NVME_SMART_SECTION_RE = re.compile(
+    r"SMART/Health Information.*?Power On Hours\s*:\s*([\d,]+)", re.IGNORECASE | re.DOTALL
+)
+
+# 属性9通电时间（特殊 XXXh+YYm 格式与纯数字格式）
+_ATTR9_SPECIAL_RE = re.compile(
+    r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)h(?:\+(\d+)m(?:\+(\d+)\.\d+s)?)?",
+    re.IGNORECASE | re.MULTILINE
+)
+_ATTR9_NUMERIC_RE = re.compile(
+    r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)\s*$", re.IGNORECASE | re.MULTILINE
+)
+_POH_SPECIAL_RE = re.compile(r"(\d+)h(?:\+(\d+)m(?:\+(\d+)\.\d+s)?)?")
+
+# 完整信息缓存只保留这些键，device/status每轮都会重新生成
+_CACHE_KEYS = ("model", "serial", "capacity", "health", "temperature", "power_on_hours", "attributes")
+
+# SMART健康状态中英文映射
+_HEALTH_MAP = {
+    "PASSED": "良好",
+    "PASS": "良好",
+    "OK": "良好",
+    "GOOD": "良好",
+    "FAILED": "故障",
+    "FAIL": "故障",
+    "ERROR": "错误",
+    "WARNING": "警告",
+    "CRITICAL": "严重",
+    "UNKNOWN": "未知",
+    "NOT AVAILABLE": "不可用"
+}
+
+# zpool输出解析
+_WS_RE = re.compile(r'\s+')
+_SCRUB_PROGRESS_RE = re.compile(r'(\d+\.?\d*)%')
+_SCRUB_REPAIRED_RE = re.compile(r'([\d.]+[KMGT]?).*repaired')
+_SCRUB_TIME_RE = re.compile(r'(\d{2}:\d{2}:\d{2})\s+to\s+go')
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str):
+    """extract_value的字符串模式按需编译并长期缓存"""
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple):
+    """整组模式编译一次缓存，第二块磁盘起同组查找直接命中"""
+    return tuple(
+        p if isinstance(p, re.Pattern) else _compile_pattern(p)
+        for p in patterns
+    )
+
 class DiskManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
         self.logger = _LOGGER.getChild("disk_manager")
-        self.logger.setLevel(logging.DEBUG)
         self.disk_status_cache = {}  # 缓存磁盘状态 {"sda": "活动中", ...}
         self.disk_full_info_cache = {}  # 缓存磁盘完整信息
         self.first_run = True  # 首次运行标志
         self.initial_detection_done = False  # 首次完整检测完成标志
-        self.disk_io_stats_cache = {}  # 缓存磁盘I/O统计信息
+        self.disk_io_stats_cache = {}  # 缓存磁盘I/O统计 {设备: (read_ios, write_ios, in_flight, io_ticks)}
+        self._ignore_raw = None  # 忽略列表原始配置串，变化时才重新解析
+        self._ignore_set = frozenset()
     
     def extract_value(self, text: str, patterns, default="未知", format_func=None):
         if not text:
             return default
         
-        if not isinstance(patterns, list):
-            patterns = [patterns]
+        if isinstance(patterns, (str, re.Pattern)):
+            patterns = (patterns,)
             
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+        # 整组模式经lru_cache编译，同一组模式只编译一次
+        for pattern in _compile_patterns(tuple(patterns)):
+            matches = pattern.findall(text)
             if matches:
                 value = matches[0]
                 try:
@@ -45,51 +139,37 @@ class DiskManager:
             # 处理逗号分隔的数字（如 "1,000,204,886,016 bytes"）
             capacity_str = capacity_str.replace(',', '')
             
-            # 提取数字和单位
-            import re
-            # 匹配数字和单位（如 "500 GB", "1.0 TB", "1000204886016 bytes", "1,000,204,886,016 bytes"）
-            match = re.search(r'(\d+(?:\.\d+)?)\s*([KMGT]?B|bytes?)', capacity_str, re.IGNORECASE)
+            # 提取数字和单位（如 "500 GB", "1.0 TB", "1000204886016 bytes"）
+            match = _CAPACITY_RE.search(capacity_str)
             if not match:
-                # 如果没有匹配到单位，尝试直接提取数字
-                numbers = re.findall(r'\d+', capacity_str)
-                if numbers:
-                    # 取最大的数字（通常是容量值）
-                    value = float(max(numbers, key=len))
-                    bytes_value = value  # 假设为字节
-                else:
+                # 没有单位时手工收集最长数字串，不再做第二次正则扫描
+                best = cur = ""
+                for ch in capacity_str:
+                    if ch.isdigit():
+                        cur += ch
+                    else:
+                        if len(cur) > len(best):
+                            best = cur
+                        cur = ""
+                if len(cur) > len(best):
+                    best = cur
+                if not best:
                     return capacity_str
+                bytes_value = float(best)  # 假设为字节
             else:
                 value = float(match.group(1))
-                unit = match.group(2).upper()
-                
-                # 转换为字节
-                if unit in ['B', 'BYTE', 'BYTES']:
-                    bytes_value = value
-                elif unit in ['KB', 'KIB']:
-                    bytes_value = value * 1024
-                elif unit in ['MB', 'MIB']:
-                    bytes_value = value * 1024 * 1024
-                elif unit in ['GB', 'GIB']:
-                    bytes_value = value * 1024 * 1024 * 1024
-                elif unit in ['TB', 'TIB']:
-                    bytes_value = value * 1024 * 1024 * 1024 * 1024
-                else:
-                    bytes_value = value  # 默认假设为字节
+                # 单位查表转换为字节，未知单位默认按字节处理
+                bytes_value = value * _UNIT_MULTIPLIER.get(match.group(2).upper(), 1)
             
-            # 转换为合适的单位
-            if bytes_value >= 1024**4:  # 1 TB
-                return f"{bytes_value / (1024**4):.1f} TB"
-            elif bytes_value >= 1024**3:  # 1 GB
-                return f"{bytes_value / (1024**3):.1f} GB"
-            elif bytes_value >= 1024**2:  # 1 MB
-                return f"{bytes_value / (1024**2):.1f} MB"
-            elif bytes_value >= 1024:  # 1 KB
-                return f"{bytes_value / 1024:.1f} KB"
+            # 用bit_length一步选出输出单位，替代四级if/elif
+            if bytes_value >= 1:
+                exp = min((int(bytes_value).bit_length() - 1) // 10, 4)
             else:
-                return f"{bytes_value:.1f} B"
+                exp = 0
+            return f"{bytes_value / (1024 ** exp):.1f} {_CAP_UNITS[exp]}"
                 
         except Exception as e:
-            self.logger.debug(f"格式化容量失败: {capacity_str}, 错误: {e}")
+            self.logger.debug("格式化容量失败: %s, 错误: %s", capacity_str, e)
             return capacity_str
     
     async def check_disk_active(self, device: str, window: int = 30, current_status: str = None) -> bool:
@@ -99,11 +179,11 @@ class DiskManager:
             if current_status is None:
                 current_status = await self.get_disk_activity(device)
             else:
-                self.logger.debug(f"使用传入的状态: {device} = {current_status}")
+                self.logger.debug("使用传入的状态: %s = %s", device, current_status)
             
             # 如果硬盘处于休眠状态，直接返回非活跃
             if current_status == "休眠中":
-                self.logger.debug(f"硬盘 {device} 处于休眠状态，不执行详细检测")
+                self.logger.debug("硬盘 %s 处于休眠状态，不执行详细检测", device)
                 return False
             
             # 如果硬盘处于空闲状态，检查是否有近期活动
@@ -122,48 +202,50 @@ class DiskManager:
                             
                             cached_stats = self.disk_io_stats_cache.get(device)
                             if cached_stats:
-                                read_diff = current_read_ios - cached_stats.get('read_ios', 0)
-                                write_diff = current_write_ios - cached_stats.get('write_ios', 0)
-                                io_ticks_diff = current_io_ticks - cached_stats.get('io_ticks', 0)
+                                read_diff = current_read_ios - cached_stats[0]
+                                write_diff = current_write_ios - cached_stats[1]
+                                io_ticks_diff = current_io_ticks - cached_stats[3]
                                 
                                 # 如果在最近30秒内有I/O活动，认为硬盘活跃
                                 if read_diff > 0 or write_diff > 0 or io_ticks_diff > 100:
-                                    self.logger.debug(f"硬盘 {device} 近期有I/O活动，需要更新信息")
+                                    self.logger.debug("硬盘 %s 近期有I/O活动，需要更新信息", device)
                                     return True
                             
-                            # 更新缓存
-                            self.disk_io_stats_cache[device] = {
-                                'read_ios': current_read_ios,
-                                'write_ios': current_write_ios,
-                                'io_ticks': current_io_ticks
-                            }
+                            # 更新缓存（元组布局与get_disk_activity一致）
+                            self.disk_io_stats_cache[device] = (
+                                current_read_ios, current_write_ios, 0, current_io_ticks
+                            )
                             
                         except (ValueError, IndexError):
                             pass
                 
                 # 如果硬盘空闲且没有近期活动，使用缓存信息
-                self.logger.debug(f"硬盘 {device} 处于空闲状态且无近期活动，使用缓存信息")
+                self.logger.debug("硬盘 %s 处于空闲状态且无近期活动，使用缓存信息", device)
                 return False
             
             # 如果硬盘处于活动中，返回活跃状态
             if current_status == "活动中":
-                self.logger.debug(f"硬盘 {device} 处于活动中，执行详细检测")
+                self.logger.debug("硬盘 %s 处于活动中，执行详细检测", device)
                 return True
             
             # 默认情况下返回活跃状态
-            self.logger.debug(f"硬盘 {device} 状态未知，默认执行详细检测")
+            self.logger.debug("硬盘 %s 状态未知，默认执行详细检测", device)
             return True
                 
         except Exception as e:
-            self.logger.error(f"检测硬盘活动状态失败: {str(e)}")
+            self.logger.error("检测硬盘活动状态失败: %s", e)
             return True  # 出错时默认执行检测
     
-    async def get_disk_power_state(self, device: str) -> str:
-        """获取硬盘电源状态"""
+    async def get_disk_power_state(self, device: str, state_output: str = None) -> str:
+        """获取硬盘电源状态
+
+        state_output可由调用方批量读取后传入，省一次SSH往返。
+        """
         try:
             # 检查 SCSI 设备状态
-            state_path = f"/sys/block/{device}/device/state"
-            state_output = await self.coordinator.run_command(f"cat {state_path} 2>/dev/null || echo 'unknown'")
+            if state_output is None:
+                state_path = f"/sys/block/{device}/device/state"
+                state_output = await self.coordinator.run_command(f"cat {state_path} 2>/dev/null || echo 'unknown'")
             state = state_output.strip().lower()
             
             if state in ["running", "active"]:
@@ -183,81 +265,68 @@ class DiskManager:
             return "unknown"
             
         except Exception as e:
-            self.logger.debug(f"获取磁盘 {device} 电源状态失败: {e}")
+            self.logger.debug("获取磁盘 %s 电源状态失败: %s", device, e)
             return "unknown"
     
     async def get_disk_activity(self, device: str) -> str:
         """获取硬盘活动状态（活动中/空闲中/休眠中）"""
         try:
+            # 电源状态文件和I/O统计文件合并为一次SSH往返读取
+            state_output, stat_output = await self.coordinator.run_commands_batch([
+                f"cat /sys/block/{device}/device/state 2>/dev/null || echo 'unknown'",
+                f"cat /sys/block/{device}/stat 2>/dev/null"
+            ])
+
             # 先检查电源状态 - 这是最可靠的休眠检测方法
-            power_state = await self.get_disk_power_state(device)
+            power_state = await self.get_disk_power_state(device, state_output)
             if power_state in ["standby", "sleep"]:
-                self.logger.debug(f"硬盘 {device} 电源状态为 {power_state}，判定为休眠中")
+                self.logger.debug("硬盘 %s 电源状态为 %s，判定为休眠中", device, power_state)
                 return "休眠中"
             
-            # 检查最近的I/O活动 - 使用非侵入性方式
-            stat_path = f"/sys/block/{device}/stat"
-            stat_output = await self.coordinator.run_command(f"cat {stat_path} 2>/dev/null")
-            
             if stat_output:
                 stats = stat_output.split()
                 if len(stats) >= 11:
                     try:
+                        # 一次性解析所需字段，后续分支复用局部变量
+                        read_ios = int(stats[0])
+                        write_ios = int(stats[4])
                         in_flight = int(stats[8])  # 当前进行中的I/O
                         io_ticks = int(stats[9])   # I/O活动时间(ms)
                         
                         # 如果有正在进行的I/O，返回活动中
                         if in_flight > 0:
-                            self.logger.debug(f"硬盘 {device} 有进行中的I/O操作: {in_flight}")
+                            self.logger.debug("硬盘 %s 有进行中的I/O操作: %s", device, in_flight)
                             return "活动中"
                         
+                        new_stats = (read_ios, write_ios, in_flight, io_ticks)
+                        
                         # 检查缓存的统计信息来判断近期活动
                         cached_stats = self.disk_io_stats_cache.get(device)
                         if cached_stats:
-                            current_read_ios = int(stats[0])
-                            current_write_ios = int(stats[4])
-                            
-                            read_diff = current_read_ios - cached_stats.get('read_ios', 0)
-                            write_diff = current_write_ios - cached_stats.get('write_ios', 0)
-                            io_ticks_diff = io_ticks - cached_stats.get('io_ticks', 0)
+                            read_diff = read_ios - cached_stats[0]
+                            write_diff = write_ios - cached_stats[1]
+                            io_ticks_diff = io_ticks - cached_stats[3]
                             
                             # 如果在最近30秒内有I/O活动，认为硬盘活动中
                             if read_diff > 0 or write_diff > 0 or io_ticks_diff > 100:  # 100ms内的活动
-                                self.logger.debug(f"硬盘 {device} 近期有I/O活动: 读={read_diff}, 写={write_diff}, 活动时间={io_ticks_diff}ms")
-                                
-                                # 更新缓存统计信息
-                                self.disk_io_stats_cache[device] = {
-                                    'read_ios': current_read_ios,
-                                    'write_ios': current_write_ios,
-                                    'in_flight': in_flight,
-                                    'io_ticks': io_ticks
-                                }
+                                self.logger.debug("硬盘 %s 近期有I/O活动: 读=%s, 写=%s, 活动时间=%sms", device, read_diff, write_diff, io_ticks_diff)
+                                self.disk_io_stats_cache[device] = new_stats
                                 return "活动中"
                         else:
                             # 首次检测，保存当前状态并认为活跃
-                            self.logger.debug(f"硬盘 {device} 首次检测，保存统计信息")
-                            self.disk_io_stats_cache[device] = {
-                                'read_ios': int(stats[0]),
-                                'write_ios': int(stats[4]),
-                                'in_flight': in_flight,
-                                'io_ticks': io_ticks
-                            }
+                            self.logger.debug("硬盘 %s 首次检测，保存统计信息", device)
+                            self.disk_io_stats_cache[device] = new_stats
                             return "活动中"  # 首次检测默认返回活动中
                         
                         # 更新缓存统计信息
-                        self.disk_io_stats_cache[device] = {
-                            'read_ios': int(stats[0]),
-                            'write_ios': int(stats[4]),
-                            'in_flight': in_flight,
-                            'io_ticks': io_ticks
-                        }
+                        self.disk_io_stats_cache[device] = new_stats
                         
                         # 如果没有活动，返回空闲中
-                        self.logger.debug(f"硬盘 {device} 处于空闲状态")
+                        self.logger.debug("硬盘 %s 处于空闲状态", device)
                         return "空闲中"
                         
                     except (ValueError, IndexError) as e:
-                        self.logger.debug(f"解析硬盘 {device} 统计信息失败: {e}")
+                        self.logger.debug("解析硬盘 %s 统计信息失败: %s", device, e)
                         return "活动中"  # 出错时默认返回活动中，避免中断休眠
             
             # 如果无法获取统计信息，检查硬盘是否可访问
@@ -265,17 +334,17 @@ class DiskManager:
                 # 尝试读取设备信息，如果成功说明硬盘可访问
                 test_output = await self.coordinator.run_command(f"ls -la /dev/{device} 2>/dev/null")
                 if test_output and device in test_output:
-                    self.logger.debug(f"硬盘 {device} 可访问但无统计信息，默认返回活动中")
+                    self.logger.debug("硬盘 %s 可访问但无统计信息，默认返回活动中", device)
                     return "活动中"
                 else:
-                    self.logger.debug(f"硬盘 {device} 不可访问，可能处于休眠状态")
+                    self.logger.debug("硬盘 %s 不可访问，可能处于休眠状态", device)
                     return "休眠中"
             except:
-                self.logger.debug(f"硬盘 {device} 检测失败，默认返回活动中")
+                self.logger.debug("硬盘 %s 检测失败，默认返回活动中", device)
                 return "活动中"
             
         except Exception as e:
-            self.logger.error(f"获取硬盘 {device} 状态失败: {str(e)}", exc_info=True)
+            self.logger.error("获取硬盘 %s 状态失败: %s", device, e, exc_info=True)
             return "活动中"  # 出错时默认返回活动中，避免中断休眠
     
     async def get_disks_info(self) -> list[dict]:
@@ -294,109 +363,42 @@ class DiskManager:
             
             self.logger.debug("Found %d block devices", len(devices))
             
-            ignore_list = self.coordinator.config.get(CONF_IGNORE_DISKS, "").split(",")
+            # 忽略列表解析成frozenset并缓存，配置串没变就不重新分割
+            cfg = self.coordinator.config.get(CONF_IGNORE_DISKS, "")
+            if cfg != self._ignore_raw:
+                self._ignore_set = frozenset(x.strip() for x in cfg.split(",") if x.strip())
+                self._ignore_raw = cfg
+            ignore_list = self._ignore_set
             self.logger.debug("Ignoring disks: %s", ignore_list)
             
+            # 过滤后各磁盘的检测相互独立，并发执行；信号量限制同时在跑的smartctl数量
+            candidates = []
             for dev_info in devices:
                 device = dev_info["name"]
                 if device in ignore_list:
                     self.logger.debug("Skipping ignored disk: %s", device)
                     continue
-                    
                 if dev_info["type"] not in ["disk", "nvme", "rom"]:
                     self.logger.debug("Skipping non-disk device: %s (type: %s)", device, dev_info["type"])
                     continue
-                
-                device_path = f"/dev/{device}"
-                disk_info = {"device": device}
-                self.logger.debug("Processing disk: %s", device)
-                
-                # 获取硬盘状态（活动中/空闲中/休眠中）
-                status = await self.get_disk_activity(device)
-                disk_info["status"] = status
-                
-                # 更新状态缓存
-                self.disk_status_cache[device] = status
-                
-                # 检查是否有缓存的完整信息
-                cached_info = self.disk_full_info_cache.get(device, {})
-                
-                # 优化点：首次运行时强制获取完整信息
-                if self.first_run:
-                    self.logger.debug(f"首次运行，强制获取硬盘 {device} 的完整信息")
-                    try:
-                        # 执行完整的信息获取
-                        await self._get_full_disk_info(disk_info, device_path)
-                        # 更新缓存
-                        self.disk_full_info_cache[device] = disk_info.copy()
-                    except Exception as e:
-                        self.logger.warning(f"首次运行获取硬盘信息失败: {str(e)}", exc_info=True)
-                        # 使用缓存信息（如果有）
-                        disk_info.update(cached_info)
-                        disk_info.update({
-                            "model": "未知" if not cached_info.get("model") else cached_info["model"],
-                            "serial": "未知" if not cached_info.get("serial") else cached_info["serial"],
-                            "capacity": "未知" if not cached_info.get("capacity") else cached_info["capacity"],
-                            "health": "检测失败" if not cached_info.get("health") else cached_info["health"],
-                            "temperature": "未知" if not cached_info.get("temperature") else cached_info["temperature"],
-                            "power_on_hours": "未知" if not cached_info.get("power_on_hours") else cached_info["power_on_hours"],
-                            "attributes": cached_info.get("attributes", {})
-                        })
-                    disks.append(disk_info)
-                    continue
-                
-                # 检查硬盘是否活跃，传入当前状态确保一致性
-                is_active = await self.check_disk_active(device, window=30, current_status=status)
-                if not is_active:
-                    self.logger.debug(f"硬盘 {device} 处于非活跃状态，使用上一次获取的信息")
-                    
-                    # 优先使用缓存的完整信息
-                    if cached_info:
-                        disk_info.update({
-                            "model": cached_info.get("model", "未知"),
-                            "serial": cached_info.get("serial", "未知"),
-                            "capacity": cached_info.get("capacity", "未知"),
-                            "health": cached_info.get("health", "未知"),
-                            "temperature": cached_info.get("temperature", "未知"),
-                            "power_on_hours": cached_info.get("power_on_hours", "未知"),
-                            "attributes": cached_info.get("attributes", {})
-                        })
-                    else:
-                        # 如果没有缓存信息，使用默认值
-                        disk_info.update({
-                            "model": "未知",
-                            "serial": "未知",
-                            "capacity": "未知",
-                            "health": "未知",
-                            "temperature": "未知",
-                            "power_on_hours": "未知",
-                            "attributes": {}
-                        })
-                    
-                    disks.append(disk_info)
+                candidates.append(dev_info)
+
+            sem = asyncio.Semaphore(4)
+
+            async def _bounded(dev_info):
+                async with sem:
+                    return await self._process_one_disk(dev_info)
+
+            results = await asyncio.gather(
+                *(_bounded(d) for d in candidates), return_exceptions=True
+            )
+            for dev_info, result in zip(candidates, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(
+                        "处理硬盘 %s 失败: %s", dev_info["name"], result
+                    )
                     continue
-                
-                try:
-                    # 执行完整的信息获取
-                    await self._get_full_disk_info(disk_info, device_path)
-                    # 更新缓存
-                    self.disk_full_info_cache[device] = disk_info.copy()
-                except Exception as e:
-                    self.logger.warning(f"获取硬盘信息失败: {str(e)}", exc_info=True)
-                    # 使用缓存信息（如果有）
-                    disk_info.update(cached_info)
-                    disk_info.update({
-                        "model": "未知" if not cached_info.get("model") else cached_info["model"],
-                        "serial": "未知" if not cached_info.get("serial") else cached_info["serial"],
-                        "capacity": "未知" if not cached_info.get("capacity") else cached_info["capacity"],
-                        "health": "检测失败" if not cached_info.get("health") else cached_info["health"],
-                        "temperature": "未知" if not cached_info.get("temperature") else cached_info["temperature"],
-                        "power_on_hours": "未知" if not cached_info.get("power_on_hours") else cached_info["power_on_hours"],
-                        "attributes": cached_info.get("attributes", {})
-                    })
-                
-                disks.append(disk_info)
-                self.logger.debug("Processed disk %s: %s", device, disk_info)
+                disks.append(result)
             
             # 首次运行完成后标记
             if self.first_run:
@@ -411,11 +413,110 @@ class DiskManager:
             self.logger.error("Failed to get disk info: %s", str(e), exc_info=True)
             return []
     
+    def _merge_cached(self, disk_info, cached_info, fail_health=False):
+        """用缓存信息一次性补全disk_info，缓存缺失的字段落默认值"""
+        disk_info.update({
+            "model": cached_info.get("model") or "未知",
+            "serial": cached_info.get("serial") or "未知",
+            "capacity": cached_info.get("capacity") or "未知",
+            "health": cached_info.get("health") or ("检测失败" if fail_health else "未知"),
+            "temperature": cached_info.get("temperature") or "未知",
+            "power_on_hours": cached_info.get("power_on_hours") or "未知",
+            "attributes": cached_info.get("attributes", {})
+        })
+
+    async def _process_one_disk(self, dev_info) -> dict:
+        """获取单块磁盘的状态与详细信息（供get_disks_info并发调度）"""
+        device = dev_info["name"]
+
+        # 光驱没有有意义的SMART数据，smartctl探测还可能阻塞，直接返回简要记录
+        if dev_info["type"] == "rom":
+            self.logger.debug("Skipping SMART queries for optical device: %s", device)
+            return {
+                "device": device,
+                "status": "N/A",
+                "model": "光驱",
+                "serial": "未知",
+                "capacity": "未知",
+                "health": "未知",
+                "temperature": "未知",
+                "power_on_hours": "未知",
+                "attributes": {}
+            }
+
+        device_path = f"/dev/{device}"
+        disk_info = {"device": device}
+        self.logger.debug("Processing disk: %s", device)
+        
+        # 获取硬盘状态（活动中/空闲中/休眠中）
+        status = await self.get_disk_activity(device)
+        disk_info["status"] = status
+        
+        # 更新状态缓存
+        self.disk_status_cache[device] = status
+        
+        # 检查是否有缓存的完整信息
+        cached_info = self.disk_full_info_cache.get(device, {})
+        
+        # 优化点：首次运行时强制获取完整信息
+        if self.first_run:
+            self.logger.debug("首次运行，强制获取硬盘 %s 的完整信息", device)
+            try:
+                # 执行完整的信息获取
+                await self._get_full_disk_info(disk_info, device_path)
+                # 更新缓存（只快照信息字段，不复制整个字典）
+                self.disk_full_info_cache[device] = {
+                    k: disk_info[k] for k in _CACHE_KEYS if k in disk_info
+                }
+            except Exception as e:
+                self.logger.warning("首次运行获取硬盘信息失败: %s", e, exc_info=True)
+                # 使用缓存信息（如果有）
+                self._merge_cached(disk_info, cached_info, fail_health=True)
+            return disk_info
+        
+        # get_disk_activity已经基于电源状态与I/O差值得出结论，直接映射活跃度，
+        # 不再二次读取/sys统计（check_disk_active保留给其它调用方）
+        if status == "活动中":
+            is_active = True
+        elif status in ("休眠中", "空闲中"):
+            is_active = False
+        else:
+            is_active = True  # 状态未知时默认执行详细检测
+        if not is_active:
+            self.logger.debug("硬盘 %s 处于非活跃状态，使用上一次获取的信息", device)
+            
+            # 优先使用缓存的完整信息，没有缓存时各字段落默认值
+            self._merge_cached(disk_info, cached_info)
+            
+            return disk_info
+        
+        try:
+            # 执行完整的信息获取
+            await self._get_full_disk_info(disk_info, device_path)
+            # 更新缓存（只快照信息字段，不复制整个字典）
+            self.disk_full_info_cache[device] = {
+                k: disk_info[k] for k in _CACHE_KEYS if k in disk_info
+            }
+        except Exception as e:
+            self.logger.warning("获取硬盘信息失败: %s", e, exc_info=True)
+            # 使用缓存信息（如果有）
+            self._merge_cached(disk_info, cached_info, fail_health=True)
+        
+        self.logger.debug("Processed disk %s: %s", device, disk_info)
+        return disk_info
+
+
     async def _get_full_disk_info(self, disk_info, device_path):
         """获取硬盘的完整信息（模型、序列号、健康状态等）"""
-        # 获取基本信息 - 首先尝试NVMe格式
-        info_output = await self.coordinator.run_command(f"smartctl -i {device_path}")
-        self.logger.debug("smartctl -i output for %s: %s", disk_info["device"], info_output[:200] + "..." if len(info_output) > 200 else info_output)
+        # 一次smartctl -x取回识别、健康与属性全部信息，替代-i/-H/-A三次执行
+        smart_output = await self.coordinator.run_command(f"smartctl -x {device_path}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # 切片和拼接只在调试级别开启时才做
+            self.logger.debug(
+                "smartctl -x output for %s: %s", disk_info["device"],
+                smart_output[:200] + "..." if len(smart_output) > 200 else smart_output
+            )
+        info_output = smart_output
         
         # 检查是否为NVMe设备
         is_nvme = "nvme" in disk_info["device"].lower()
@@ -454,9 +555,8 @@ class DiskManager:
         disk_info["capacity"] = self._format_capacity(raw_capacity)
         
         # 健康状态
-        health_output = await self.coordinator.run_command(f"smartctl -H {device_path}")
         raw_health = self.extract_value(
-            health_output,
+            smart_output,
             [
                 r"SMART overall-health self-assessment test result:\s*(.+)",
                 r"SMART Health Status:\s*(.+)"
@@ -464,59 +564,41 @@ class DiskManager:
             default="UNKNOWN"
         )
 
-        # 健康状态中英文映射
-        health_map = {
-            "PASSED": "良好",
-            "PASS": "良好",
-            "OK": "良好",
-            "GOOD": "良好",
-            "FAILED": "故障",
-            "FAIL": "故障",
-            "ERROR": "错误",
-            "WARNING": "警告",
-            "CRITICAL": "严重",
-            "UNKNOWN": "未知",
-            "NOT AVAILABLE": "不可用"
-        }
-
-        # 转换为中文（不区分大小写）
-        disk_info["health"] = health_map.get(raw_health.strip().upper(), "未知")
-        
-        # 获取详细数据
-        data_output = await self.coordinator.run_command(f"smartctl -A {device_path}")
-        self.logger.debug("smartctl -A output for %s: %s", disk_info["device"], data_output[:200] + "..." if len(data_output) > 200 else data_output)
-        
-        # 智能温度检测逻辑 - 处理多温度属性
-        temp_patterns = [
-            # 新增的NVMe专用模式
-            r"Temperature:\s*(\d+)\s*Celsius",  # 匹配 NVMe 格式
-            r"Composite:\s*\+?(\d+\.?\d*)°C",    # 匹配 NVMe 复合温度
-            # 优先匹配属性194行（通常包含当前温度）
-            r"194\s+Temperature_Celsius\s+.*?(\d+)\s*(?:$|$)",
-            
-            # 匹配其他温度属性
-            r"\bTemperature_Celsius\b.*?(\d+)\b",
-            r"Current Temperature:\s*(\d+)",
-            r"Airflow_Temperature_Cel\b.*?(\d+)\b",
-            r"Temp\s*[=:]\s*(\d+)"
-        ]
+        # 转换为中文（不区分大小写），映射表为模块级常量
+        disk_info["health"] = _HEALTH_MAP.get(raw_health.strip().upper(), "未知")
+        
+        # 详细属性同样来自-x输出
+        data_output = smart_output
         
-        # 查找所有温度值
+        # 单遍按行分拣输出，后续各组正则只扫描命中的少量短行而非整个文本
+        temp_lines, line194_lines, attr9_lines, nvme_poh_lines = [], [], [], []
+        for line in data_output.splitlines():
+            if "Temp" in line or "Composite" in line:
+                temp_lines.append(line)
+                if "Temperature_Celsius" in line and line.lstrip().startswith("194"):
+                    line194_lines.append(line)
+            if "Power_On_Hours" in line:
+                attr9_lines.append(line)
+            elif "Power On" in line or "Power on" in line:
+                nvme_poh_lines.append(line)
+        temp_blob = "\n".join(temp_lines)
+        line194_blob = "\n".join(line194_lines)
+        attr9_blob = "\n".join(attr9_lines)
+        nvme_poh_blob = "\n".join(nvme_poh_lines)
+        
+        # 智能温度检测逻辑 - 融合正则单遍扫描，按命中的分组取值
         temperatures = []
-        for pattern in temp_patterns:
-            matches = re.findall(pattern, data_output, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                for match in matches:
-                    try:
-                        temperatures.append(int(match))
-                    except ValueError:
-                        pass
+        if temp_lines:
+            for m in _TEMP_FUSED_RE.finditer(temp_blob):
+                try:
+                    temperatures.append(int(m.group(m.lastgroup)))
+                except (TypeError, ValueError):
+                    pass
         
         # 优先选择属性194的温度值，如果没有则选择最大值
         if temperatures:
             # 优先选择属性194的值（如果存在）
-            primary_match = re.search(r"194\s+Temperature_Celsius\s+.*?(\d+)\s*(?:\(|$)", 
-                                    data_output, re.IGNORECASE | re.MULTILINE)
+            primary_match = _TEMP194_PRIMARY_RE.search(line194_blob)
             if primary_match:
                 disk_info["temperature"] = f"{primary_match.group(1)} °C"
             else:
@@ -531,18 +613,15 @@ class DiskManager:
         # 检查是否为NVMe设备
         is_nvme = "nvme" in disk_info["device"].lower()
         
+        # 分拣阶段已定位候选行，没有相应行时后面的方法全部跳过
+        has_attr9 = bool(attr9_lines)
+        has_poh_text = has_attr9 or bool(nvme_poh_lines)
+        
         # 方法0：NVMe设备的通电时间提取（优先处理）
-        if is_nvme:
+        if is_nvme and has_poh_text:
             # NVMe格式的通电时间提取 - 支持带逗号的数字格式
-            nvme_patterns = [
-                r"Power On Hours\s*:\s*([\d,]+)",  # 支持带逗号的数字格式（如 "6,123"）
-                r"Power On Time\s*:\s*([\d,]+)",  # NVMe备用格式
-                r"Power on hours\s*:\s*([\d,]+)",  # 小写格式
-                r"Power on time\s*:\s*([\d,]+)",  # 小写格式
-            ]
-            
-            for pattern in nvme_patterns:
-                match = re.search(pattern, data_output, re.IGNORECASE)
+            for pattern in _NVME_POH_RES:
+                match = pattern.search(nvme_poh_blob)
                 if match:
                     try:
                         # 处理带逗号的数字格式（如 "6,123"）
@@ -557,8 +636,7 @@ class DiskManager:
             # 如果还没找到，尝试在SMART数据部分查找
             if power_on_hours == "未知":
                 # 查找SMART数据部分中的Power On Hours
-                smart_section_match = re.search(r"SMART/Health Information.*?Power On Hours\s*:\s*([\d,]+)", 
-                                               data_output, re.IGNORECASE | re.DOTALL)
+                smart_section_match = _NVME_SMART_SECTION_RE.search(data_output)
                 if smart_section_match:
                     try:
                         hours_str = smart_section_match.group(1).replace(',', '')
@@ -569,10 +647,7 @@ class DiskManager:
                         pass
         
         # 方法1：提取属性9的RAW_VALUE（处理特殊格式）
-        attr9_match = re.search(
-            r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)h(?:\+(\d+)m(?:\+(\d+)\.\d+s)?)?",
-            data_output, re.IGNORECASE | re.MULTILINE
-        )
+        attr9_match = _ATTR9_SPECIAL_RE.search(attr9_blob) if has_attr9 else None
         if attr9_match:
             try:
                 hours = int(attr9_match.group(1))
@@ -586,11 +661,8 @@ class DiskManager:
                 pass
         
         # 方法2：如果方法1失败，尝试提取纯数字格式
-        if power_on_hours == "未知":
-            attr9_match = re.search(
-                r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)\s*$",
-                data_output, re.IGNORECASE | re.MULTILINE
-            )
+        if power_on_hours == "未知" and has_attr9:
+            attr9_match = _ATTR9_NUMERIC_RE.search(attr9_blob)
             if attr9_match:
                 try:
                     power_on_hours = f"{int(attr9_match.group(1))} 小时"
@@ -599,9 +671,9 @@ class DiskManager:
                     pass
         
         # 方法3：如果前两种方法失败，使用原来的多模式匹配
-        if power_on_hours == "未知":
+        if power_on_hours == "未知" and has_poh_text:
             power_on_hours = self.extract_value(
-                data_output,
+                attr9_blob + "\n" + nvme_poh_blob,
                 [
                     # 精确匹配属性9行
                     r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)\s*$",
@@ -618,40 +690,47 @@ class DiskManager:
             if power_on_hours != "未知":
                 self.logger.debug("Found power_on_hours via method3: %s", power_on_hours)
         
-        # 方法4：如果还没找到，尝试扫描整个属性表
-        if power_on_hours == "未知":
-            for line in data_output.split('\n'):
-                if "Power_On_Hours" in line:
-                    # 尝试提取特殊格式
-                    match = re.search(r"(\d+)h(?:\+(\d+)m(?:\+(\d+)\.\d+s)?)?", line)
-                    if match:
-                        try:
-                            hours = int(match.group(1))
-                            if match.group(2):
-                                minutes = int(match.group(2))
-                                hours += minutes / 60
-                            power_on_hours = f"{hours:.1f} 小时"
-                            self.logger.debug("Found power_on_hours via method4 (special format): %s", power_on_hours)
-                            break
-                        except:
-                            pass
-                            
-                    # 尝试提取纯数字
-                    fields = line.split()
-                    if fields and fields[-1].isdigit():
-                        try:
-                            power_on_hours = f"{int(fields[-1])} 小时"
-                            self.logger.debug("Found power_on_hours via method4 (numeric): %s", power_on_hours)
-                            break
-                        except:
-                            pass
-        
+        # 方法4：如果还没找到，尝试扫描整个属性表（纯字符串解析，不走正则）
+        if power_on_hours == "未知" and has_attr9:
+            for line in attr9_lines:
+                # 特殊格式（如 64h+23m+12.345s）：定位数字后跟'h'的位置，向前收集数字
+                idx = line.find('h')
+                while idx != -1 and not (idx > 0 and line[idx - 1].isdigit()):
+                    idx = line.find('h', idx + 1)
+                if idx > 0:
+                    start = idx - 1
+                    while start > 0 and line[start - 1].isdigit():
+                        start -= 1
+                    try:
+                        hours = int(line[start:idx])
+                        # '+MMm' 分钟部分同样手工解析
+                        if idx + 1 < len(line) and line[idx + 1] == '+':
+                            m_end = line.find('m', idx + 2)
+                            minutes_str = line[idx + 2:m_end] if m_end > 0 else ""
+                            if minutes_str.isdigit():
+                                hours += int(minutes_str) / 60
+                        power_on_hours = f"{hours:.1f} 小时"
+                        self.logger.debug("Found power_on_hours via method4 (special format): %s", power_on_hours)
+                        break
+                    except:
+                        pass
+                        
+                # 尝试提取纯数字
+                fields = line.split()
+                if fields and fields[-1].isdigit():
+                    try:
+                        power_on_hours = f"{int(fields[-1])} 小时"
+                        self.logger.debug("Found power_on_hours via method4 (numeric): %s", power_on_hours)
+                        break
+                    except:
+                        pass
+
         disk_info["power_on_hours"] = power_on_hours
         
         # 添加额外属性：温度历史记录
         temp_history = {}
-        # 提取属性194的温度历史
-        temp194_match = re.search(r"194\s+Temperature_Celsius+.*?(\s*[\d\s]+)$", data_output)
+        # 提取属性194的温度历史（同样先做子串预检）
+        temp194_match = _TEMP194_HISTORY_RE.search(line194_blob) if line194_lines else None
         if temp194_match:
             try:
                 values = [int(x) for x in temp194_match.group(1).split()]
@@ -687,7 +766,7 @@ class DiskManager:
             for line in lines[1:]:  # 跳过第一行标题
                 if line.strip():
                     # 分割制表符或连续空格
-                    parts = re.split(r'\s+', line.strip())
+                    parts = _WS_RE.split(line.strip())
                     if len(parts) >= 11:  # 根据实际输出有11个字段
                         pool_info = {
                             "name": parts[0],
@@ -713,23 +792,48 @@ class DiskManager:
             self.logger.error("Failed to get ZFS pool info: %s", str(e), exc_info=True)
             return []
     
-    async def get_zpool_status(self, pool_name: str) -> dict:
-        """获取ZFS存储池的详细状态信息，包括scrub进度"""
+    async def get_zpool_status(self, pool_names) -> dict:
+        """获取ZFS存储池的详细状态信息，包括scrub进度
+
+        支持传入单个存储池名称或名称列表；列表时只执行一次zpool status，
+        返回 {池名: scrub信息} 映射。
+        """
+        single = isinstance(pool_names, str)
+        names = [pool_names] if single else list(pool_names)
+        if not names:
+            return {}
+
+        default = {"scrub_in_progress": False}
         try:
-            self.logger.debug(f"Getting ZFS pool status for {pool_name}")
-            status_output = await self.coordinator.run_command(f"zpool status {pool_name} 2>/dev/null || echo 'NO_POOL'")
-            
+            self.logger.debug("Getting ZFS pool status for %s", names)
+            status_output = await self.coordinator.run_command(
+                f"zpool status {' '.join(names)} 2>/dev/null || echo 'NO_POOL'"
+            )
+
             if "NO_POOL" in status_output or "command not found" in status_output.lower():
-                self.logger.debug(f"ZFS pool {pool_name} not found")
-                return {"scrub_in_progress": False}
-            
-            # 解析scrub信息
-            scrub_info = self._parse_scrub_info(status_output)
-            return scrub_info
-            
+                self.logger.debug("ZFS pools %s not found", names)
+                return dict(default) if single else {n: dict(default) for n in names}
+
+            # 输出按 pool: 段落切分，各段独立解析scrub信息
+            statuses = {n: dict(default) for n in names}
+            current_name = None
+            current_lines = []
+            for line in status_output.splitlines():
+                stripped = line.strip()
+                if stripped.startswith("pool:"):
+                    if current_name in statuses:
+                        statuses[current_name] = self._parse_scrub_info('\n'.join(current_lines))
+                    current_name = stripped[5:].strip()
+                    current_lines = []
+                current_lines.append(line)
+            if current_name in statuses:
+                statuses[current_name] = self._parse_scrub_info('\n'.join(current_lines))
+
+            return statuses[names[0]] if single else statuses
+
         except Exception as e:
-            self.logger.error(f"Failed to get ZFS pool status for {pool_name}: {str(e)}", exc_info=True)
-            return {"scrub_in_progress": False}
+            self.logger.error("Failed to get ZFS pool status for %s: %s", names, e, exc_info=True)
+            return dict(default) if single else {n: dict(default) for n in names}
     
     def _parse_scrub_info(self, status_output: str) -> dict:
         """解析zpool status中的scrub信息"""
@@ -827,17 +931,17 @@ class DiskManager:
                 elif '%' in line and 'done' in line:
                     # 例如: "644M repaired, 19.23% done, 02:12:38 to go"
                     if '%' in line:
-                        progress_match = re.search(r'(\d+\.?\d*)%', line)
+                        progress_match = _SCRUB_PROGRESS_RE.search(line)
                         if progress_match:
                             scrub_info["scrub_progress"] = f"{progress_match.group(1)}%"
                     
                     if 'repaired' in line:
-                        repaired_match = re.search(r'([\d.]+[KMGT]?).*repaired', line)
+                        repaired_match = _SCRUB_REPAIRED_RE.search(line)
                         if repaired_match:
                             scrub_info["repaired"] = repaired_match.group(1)
                     
                     if 'to go' in line:
-                        time_match = re.search(r'(\d{2}:\d{2}:\d{2})\s+to\s+go', line)
+                        time_match = _SCRUB_TIME_RE.search(line)
                         if time_match:
                             scrub_info["time_remaining"] = time_match.group(1)
                 
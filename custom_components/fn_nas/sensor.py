@@ -1,4 +1,7 @@
 import logging
+import re
+import sys
+from types import MappingProxyType
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfTemperature
@@ -17,326 +20,291 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# 容量字符串后缀到单位的映射，先查两字符后缀再查单字符
+_UNIT_SUFFIX_2 = {"Ti": "TB", "Gi": "GB", "Mi": "MB"}
+_UNIT_SUFFIX_1 = {"T": "TB", "G": "GB", "M": "MB"}
+
+# 温度字符串里的数值部分（如"45°C"、"45.5 C"），模块级预编译
+_TEMP_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+# 容量字符串开头的数值部分（如"1.8T"），模块级预编译
+_NUM_RE = re.compile(r"[\d.]+")
+
+# 字节转GB的系数，乘法比每次算1024**3再做除法便宜
+_BYTES_TO_GB = 1.0 / (1024 ** 3)
+
+# 高频出现的字符串intern后全局只存一份，实体间比较退化为指针比较
+_UNKNOWN = sys.intern("未知")
+_NAS_NAME = sys.intern("飞牛NAS系统监控")
+
+# 内容固定的设备信息只构建一次，所有实体共享（与button.py保持一致）
+_NAS_DEVICE_INFO = MappingProxyType({
+    "identifiers": frozenset({(DOMAIN, DEVICE_ID_NAS)}),
+    "name": _NAS_NAME,
+    "manufacturer": "飞牛"
+})
+# 子设备指向NAS的via_device元组，全模块共用一份
+_VIA_NAS = (DOMAIN, DEVICE_ID_NAS)
+
+# 每块硬盘的设备信息按device_id记忆化，实体重载时复用旧字典
+_disk_device_info_cache = {}
+
+_ZFS_DEVICE_INFO = MappingProxyType({
+    "identifiers": frozenset({(DOMAIN, DEVICE_ID_ZFS)}),
+    "name": "ZFS存储池",
+    "via_device": (DOMAIN, DEVICE_ID_NAS)
+})
+
+# UPS传感器描述表：(uid后缀, 名称, 单位, 图标, 数据键, 设备类, 状态类)
+_UPS_SENSOR_SPECS = (
+    ("ups_battery", "UPS电池电量", "%", "mdi:battery", "battery_level",
+     SensorDeviceClass.BATTERY, SensorStateClass.MEASUREMENT),
+    ("ups_runtime", "UPS剩余时间", "分钟", "mdi:clock", "runtime_remaining",
+     None, SensorStateClass.MEASUREMENT),
+    ("ups_output_voltage", "UPS输出电压", "V", "mdi:lightning-bolt-outline", "output_voltage",
+     SensorDeviceClass.VOLTAGE, SensorStateClass.MEASUREMENT),
+    ("ups_load", "UPS负载", "%", "mdi:gauge", "load_percent",
+     None, SensorStateClass.MEASUREMENT),
+    ("ups_model", "UPS型号", None, "mdi:information", "model", None, None),
+    ("ups_status", "UPS状态", None, "mdi:power-plug", "status", None, None),
+)
+
+# 虚拟机/容器状态的中文映射，模块级构建一次
+_VM_STATE_MAP = {
+    "running": "运行中",
+    "shut off": "已关闭",
+    "paused": "已暂停",
+    "rebooting": "重启中",
+    "crashed": "崩溃"
+}
+_DOCKER_STATUS_MAP = {
+    "running": "运行中",
+    "exited": "已停止",
+    "paused": "已暂停",
+    "restarting": "重启中",
+    "dead": "死亡"
+}
+
+def _cached_native(sensor, compute):
+    """按协调器数据的id缓存native_value。
+
+    HA读取state的频率（模板、历史记录）远高于轮询间隔，而coordinator.data
+    只在刷新时整体换新；id没变就直接返回上次的计算结果。
+    """
+    data = sensor.coordinator.data
+    data_id = id(data)
+    if data_id == sensor._last_data_id:
+        return sensor._last_val
+    value = compute(data)
+    sensor._last_data_id = data_id
+    sensor._last_val = value
+    return value
+
+def _bytes_to_gb(value):
+    """字节值转GB（保留两位小数），无效输入返回None"""
+    if value is None or value == _UNKNOWN:
+        return None
+    try:
+        return round(float(value) * _BYTES_TO_GB, 2)
+    except (TypeError, ValueError):
+        return None
+
+# 虚拟机状态到图标的映射，默认mdi:server
+_VM_ICON = {
+    "running": "mdi:server",
+    "shut off": "mdi:server-off",
+    "rebooting": "mdi:server-security"
+}
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    domain_data = hass.data[DOMAIN][config_entry.entry_id]
+    domain_data = config_entry.runtime_data
     coordinator = domain_data[DATA_UPDATE_COORDINATOR]
     ups_coordinator = domain_data["ups_coordinator"]
+    # entry_id和协调器数据在整个setup里反复使用，提为本地变量
+    entry_id = config_entry.entry_id
+    data = coordinator.data
     
     entities = []
-    existing_ids = set()
-    
-    # 添加硬盘传感器
-    for disk in coordinator.data.get("disks", []):
-        # 温度传感器
-        temp_uid = f"{config_entry.entry_id}_{disk['device']}_temperature"
-        if temp_uid not in existing_ids:
-            entities.append(
-                DiskSensor(
-                    coordinator, 
-                    disk["device"], 
-                    HDD_TEMP,
-                    f"硬盘 {disk.get('model', '未知')} 温度",
-                    temp_uid,
-                    UnitOfTemperature.CELSIUS,
-                    ICON_TEMPERATURE,
-                    disk
-                )
-            )
-            existing_ids.add(temp_uid)
-        
-
-        
-        # 硬盘状态传感器
-        status_uid = f"{config_entry.entry_id}_{disk['device']}_status"
-        if status_uid not in existing_ids:
-            entities.append(
-                DiskSensor(
-                    coordinator, 
-                    disk["device"], 
-                    HDD_STATUS,
-                    f"硬盘 {disk.get('model', '未知')} 状态",
-                    status_uid,
-                    None,
-                    ICON_DISK,
-                    disk
-                )
-            )
-            existing_ids.add(status_uid)
+    # 本地绑定append，循环里省去属性查找；unique_id带实体类型后缀，天然不会重复
+    append = entities.append
+    
+    # 添加硬盘传感器（温度+状态），生成器一次extend，少走N次append
+    disks = data.get("disks", [])
+    entities.extend(
+        DiskSensor(
+            coordinator, disk["device"], HDD_TEMP,
+            f"硬盘 {disk.get('model', _UNKNOWN)} 温度",
+            entry_id + "_" + disk["device"] + "_temperature",
+            UnitOfTemperature.CELSIUS, ICON_TEMPERATURE, disk
+        )
+        for disk in disks
+    )
+    entities.extend(
+        DiskSensor(
+            coordinator, disk["device"], HDD_STATUS,
+            f"硬盘 {disk.get('model', _UNKNOWN)} 状态",
+            entry_id + "_" + disk["device"] + "_status",
+            None, ICON_DISK, disk
+        )
+        for disk in disks
+    )
     
     # 添加系统信息传感器
-    system_uid = f"{config_entry.entry_id}_system_status"
-    if system_uid not in existing_ids:
-        entities.append(
-            SystemSensor(
-                coordinator,
-                "系统状态",
-                system_uid,
-                None,
-                "mdi:server",
-            )
+    system_uid = entry_id + "_system_status"
+    append(
+        SystemSensor(
+            coordinator,
+            "系统状态",
+            system_uid,
+            None,
+            "mdi:server",
         )
-        existing_ids.add(system_uid)
+    )
     
     # 添加CPU温度传感器
-    cpu_temp_uid = f"{config_entry.entry_id}_cpu_temperature"
-    if cpu_temp_uid not in existing_ids:
-        entities.append(
-            CPUTempSensor(
-                coordinator,
-                "CPU温度",
-                cpu_temp_uid,
-                UnitOfTemperature.CELSIUS,
-                "mdi:thermometer",
-            )
+    cpu_temp_uid = entry_id + "_cpu_temperature"
+    append(
+        CPUTempSensor(
+            coordinator,
+            "CPU温度",
+            cpu_temp_uid,
+            UnitOfTemperature.CELSIUS,
+            "mdi:thermometer",
         )
-        existing_ids.add(cpu_temp_uid)
+    )
     
     # 添加主板温度传感器
-    mobo_temp_uid = f"{config_entry.entry_id}_motherboard_temperature"
-    if mobo_temp_uid not in existing_ids:
-        entities.append(
-            MoboTempSensor(
-                coordinator,
-                "主板温度",
-                mobo_temp_uid,
-                UnitOfTemperature.CELSIUS,
-                "mdi:thermometer",
-            )
+    mobo_temp_uid = entry_id + "_motherboard_temperature"
+    append(
+        MoboTempSensor(
+            coordinator,
+            "主板温度",
+            mobo_temp_uid,
+            UnitOfTemperature.CELSIUS,
+            "mdi:thermometer",
         )
-        existing_ids.add(mobo_temp_uid)
+    )
 
     # 添加虚拟机状态传感器
-    if "vms" in coordinator.data:
-        for vm in coordinator.data["vms"]:
-            vm_uid = f"{config_entry.entry_id}_flynas_vm_{vm['name']}_status"
-            if vm_uid not in existing_ids:
-                entities.append(
-                    VMStatusSensor(
-                        coordinator, 
-                        vm["name"],
-                        vm.get("title", vm["name"]),
-                        config_entry.entry_id
-                    )
-                )
-                existing_ids.add(vm_uid)
+    entities.extend(
+        VMStatusSensor(coordinator, vm["name"], vm.get("title", vm["name"]), entry_id)
+        for vm in data.get("vms", [])
+    )
 
     # 添加UPS传感器（使用UPS协调器）
-    if ups_coordinator.data:  # 检查是否有UPS数据
-        ups_data = ups_coordinator.data
-        
-        # UPS电池电量传感器
-        ups_battery_uid = f"{config_entry.entry_id}_ups_battery"
-        if ups_battery_uid not in existing_ids:
-            entities.append(
-                UPSSensor(
-                    ups_coordinator,  # 使用UPS协调器
-                    "UPS电池电量",
-                    ups_battery_uid,
-                    "%",
-                    "mdi:battery",
-                    "battery_level",
-                    device_class=SensorDeviceClass.BATTERY,
-                    state_class=SensorStateClass.MEASUREMENT
-                )
-            )
-            existing_ids.add(ups_battery_uid)
-        
-        # UPS剩余时间传感器
-        ups_runtime_uid = f"{config_entry.entry_id}_ups_runtime"
-        if ups_runtime_uid not in existing_ids:
-            entities.append(
-                UPSSensor(
-                    ups_coordinator,  # 使用UPS协调器
-                    "UPS剩余时间",
-                    ups_runtime_uid,
-                    "分钟",
-                    "mdi:clock",
-                    "runtime_remaining",
-                    state_class=SensorStateClass.MEASUREMENT
-                )
-            )
-            existing_ids.add(ups_runtime_uid)
-        
-        # UPS输出电压传感器
-        ups_output_voltage_uid = f"{config_entry.entry_id}_ups_output_voltage"
-        if ups_output_voltage_uid not in existing_ids:
-            entities.append(
-                UPSSensor(
-                    ups_coordinator,  # 使用UPS协调器
-                    "UPS输出电压",
-                    ups_output_voltage_uid,
-                    "V",
-                    "mdi:lightning-bolt-outline",
-                    "output_voltage",
-                    device_class=SensorDeviceClass.VOLTAGE,
-                    state_class=SensorStateClass.MEASUREMENT
-                )
-            )
-            existing_ids.add(ups_output_voltage_uid)
-        
-        # UPS负载传感器
-        ups_load_uid = f"{config_entry.entry_id}_ups_load"
-        if ups_load_uid not in existing_ids:
-            entities.append(
-                UPSSensor(
-                    ups_coordinator,  # 使用UPS协调器
-                    "UPS负载",
-                    ups_load_uid,
-                    "%",
-                    "mdi:gauge",
-                    "load_percent",
-                    state_class=SensorStateClass.MEASUREMENT
-                )
-            )
-            existing_ids.add(ups_load_uid)
-        
-        # UPS型号传感器
-        ups_model_uid = f"{config_entry.entry_id}_ups_model"
-        if ups_model_uid not in existing_ids:
-            entities.append(
-                UPSSensor(
-                    ups_coordinator,  # 使用UPS协调器
-                    "UPS型号",
-                    ups_model_uid,
-                    None,
-                    "mdi:information",
-                    "model"
-                )
-            )
-            existing_ids.add(ups_model_uid)
-        
-        # UPS状态传感器
-        ups_status_uid = f"{config_entry.entry_id}_ups_status"
-        if ups_status_uid not in existing_ids:
-            entities.append(
-                UPSSensor(
-                    ups_coordinator,  # 使用UPS协调器
-                    "UPS状态",
-                    ups_status_uid,
-                    None,
-                    "mdi:power-plug",
-                    "status"
-                )
+    # UPS首次刷新在后台执行，这里无条件创建，数据未就绪时实体显示None/未知
+    # 六个UPS传感器结构一致，按描述表循环创建
+    entities.extend(
+        UPSSensor(
+            ups_coordinator, name, entry_id + "_" + suffix, unit, icon, key,
+            device_class=device_class, state_class=state_class
+        )
+        for suffix, name, unit, icon, key, device_class, state_class in _UPS_SENSOR_SPECS
+    )
+
+    # 添加Docker容器状态传感器（与UPS数据无关）
+    if data.get("docker_containers") and coordinator.enable_docker:
+        entities.extend(
+            DockerContainerStatusSensor(
+                coordinator,
+                container["name"],
+                container["name"].replace(" ", "_").replace("/", "_"),
+                entry_id
             )
-            existing_ids.add(ups_status_uid)
-
-        if coordinator.data.get("docker_containers") and coordinator.enable_docker:
-            for container in coordinator.data["docker_containers"]:
-                safe_name = container["name"].replace(" ", "_").replace("/", "_")
-                sensor_uid = f"{config_entry.entry_id}_docker_{safe_name}_status"
-                if sensor_uid not in existing_ids:
-                    entities.append(
-                        DockerContainerStatusSensor(
-                            coordinator, 
-                            container["name"],
-                            safe_name,
-                            config_entry.entry_id
-                        )
-                    )
-                    existing_ids.add(sensor_uid)
+            for container in data["docker_containers"]
+        )
     
     # 添加ZFS存储池传感器
-    if "zpools" in coordinator.data:
-        for zpool in coordinator.data["zpools"]:
+    if "zpools" in data:
+        for zpool in data["zpools"]:
             safe_name = zpool["name"].replace(" ", "_").replace("/", "_").replace(".", "_")
+            zpool_uid_prefix = entry_id + "_zpool_" + safe_name
             
             # ZFS存储池健康状态传感器
-            health_uid = f"{config_entry.entry_id}_zpool_{safe_name}_health"
-            if health_uid not in existing_ids:
-                entities.append(
-                    ZFSPoolSensor(
-                        coordinator,
-                        zpool["name"],
-                        "health",
-                        f"ZFS {zpool['name']} 健康状态",
-                        health_uid,
-                        None,
-                        ICON_ZFS,
-                        zpool
-                    )
+            health_uid = zpool_uid_prefix + "_health"
+            append(
+                ZFSPoolSensor(
+                    coordinator,
+                    zpool["name"],
+                    "health",
+                    f"ZFS {zpool['name']} 健康状态",
+                    health_uid,
+                    None,
+                    ICON_ZFS,
+                    zpool
                 )
-                existing_ids.add(health_uid)
+            )
             
             # ZFS存储池容量使用率传感器
-            capacity_uid = f"{config_entry.entry_id}_zpool_{safe_name}_capacity"
-            if capacity_uid not in existing_ids:
-                entities.append(
-                    ZFSPoolSensor(
-                        coordinator,
-                        zpool["name"],
-                        "capacity",
-                        f"ZFS {zpool['name']} 使用率",
-                        capacity_uid,
-                        "%",
-                        ICON_ZFS,
-                        zpool,
-                        device_class=SensorDeviceClass.POWER_FACTOR,
-                        state_class=SensorStateClass.MEASUREMENT
-                    )
+            capacity_uid = zpool_uid_prefix + "_capacity"
+            append(
+                ZFSPoolSensor(
+                    coordinator,
+                    zpool["name"],
+                    "capacity",
+                    f"ZFS {zpool['name']} 使用率",
+                    capacity_uid,
+                    "%",
+                    ICON_ZFS,
+                    zpool,
+                    device_class=SensorDeviceClass.POWER_FACTOR,
+                    state_class=SensorStateClass.MEASUREMENT
                 )
-                existing_ids.add(capacity_uid)
+            )
             
             # ZFS存储池总大小传感器
-            size_uid = f"{config_entry.entry_id}_zpool_{safe_name}_size"
-            if size_uid not in existing_ids:
-                entities.append(
-                    ZFSPoolSensor(
-                        coordinator,
-                        zpool["name"],
-                        "size",
-                        f"ZFS {zpool['name']} 容量",
-                        size_uid,
-                        None,  # 动态确定单位
-                        ICON_ZFS,
-                        zpool
-                    )
+            size_uid = zpool_uid_prefix + "_size"
+            append(
+                ZFSPoolSensor(
+                    coordinator,
+                    zpool["name"],
+                    "size",
+                    f"ZFS {zpool['name']} 容量",
+                    size_uid,
+                    None,  # 动态确定单位
+                    ICON_ZFS,
+                    zpool
                 )
-                existing_ids.add(size_uid)
+            )
             
             # ZFS存储池scrub进度传感器
-            scrub_uid = f"{config_entry.entry_id}_zpool_{safe_name}_scrub"
-            if scrub_uid not in existing_ids:
-                entities.append(
-                    ZFSScrubSensor(
-                        coordinator,
-                        zpool["name"],
-                        f"ZFS {zpool['name']} 检查进度",
-                        scrub_uid
-                    )
+            scrub_uid = zpool_uid_prefix + "_scrub"
+            append(
+                ZFSScrubSensor(
+                    coordinator,
+                    zpool["name"],
+                    f"ZFS {zpool['name']} 检查进度",
+                    scrub_uid
                 )
-                existing_ids.add(scrub_uid)
+            )
     
     # 添加剩余内存传感器
-    mem_available_uid = f"{config_entry.entry_id}_memory_available"
-    if mem_available_uid not in existing_ids:
-        entities.append(
-            MemoryAvailableSensor(
-                coordinator,
-                "可用内存",
-                mem_available_uid,
-                "GB",
-                "mdi:memory"
-            )
+    mem_available_uid = entry_id + "_memory_available"
+    append(
+        MemoryAvailableSensor(
+            coordinator,
+            "可用内存",
+            mem_available_uid,
+            "GB",
+            "mdi:memory"
         )
-        existing_ids.add(mem_available_uid)
+    )
     
     # 添加存储卷的剩余容量传感器（每个卷一个）
-    system_data = coordinator.data.get("system", {})
+    system_data = data.get("system", {})
     volumes = system_data.get("volumes", {})
     for mount_point in volumes:
         # 创建剩余容量传感器
-        vol_avail_uid = f"{config_entry.entry_id}_{mount_point.replace('/', '_')}_available"
-        if vol_avail_uid not in existing_ids:
-            entities.append(
-                VolumeAvailableSensor(
-                    coordinator,
-                    f"{mount_point} 可用空间",
-                    vol_avail_uid,
-                    "mdi:harddisk",
-                    mount_point
-                )
+        vol_avail_uid = entry_id + "_" + mount_point.replace("/", "_") + "_available"
+        append(
+            VolumeAvailableSensor(
+                coordinator,
+                f"{mount_point} 可用空间",
+                vol_avail_uid,
+                "mdi:harddisk",
+                mount_point
             )
-            existing_ids.add(vol_avail_uid)
+        )
 
     async_add_entities(entities)
 
@@ -351,72 +319,86 @@ class DiskSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         self.disk_info = disk_info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"disk_{device_id}")},
-            "name": disk_info.get("model", "未知硬盘"),
-            "manufacturer": "硬盘设备",
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
+        # 设备类由sensor_type决定且不会变化，初始化时定死，免去属性方法调用
+        self._attr_device_class = (
+            SensorDeviceClass.TEMPERATURE if sensor_type == HDD_TEMP else None
+        )
+        # 温度字符串在两次刷新间通常不变，缓存(原始值, 解析结果)避免重复解析
+        self._temp_cache = (None, None)
+        # 协调器数据未换新时native_value直接走缓存
+        self._last_data_id = None
+        self._last_val = None
+        # 属性字典按disk_info身份缓存，同一份快照不重复构建
+        self._attrs_cache = None
+        self._attrs_src_id = None
+        device_info = _disk_device_info_cache.get(device_id)
+        if device_info is None:
+            device_info = {
+                "identifiers": frozenset({(DOMAIN, "disk_" + device_id)}),
+                "name": disk_info.get("model", "未知硬盘"),
+                "manufacturer": "硬盘设备",
+                "via_device": _VIA_NAS
+            }
+            _disk_device_info_cache[device_id] = device_info
+        self._attr_device_info = device_info
     
     @property
     def native_value(self):
-        for disk in self.coordinator.data.get("disks", []):
-            if disk["device"] == self.device_id:
-                if self.sensor_type == HDD_TEMP:
-                    temp = disk.get("temperature")
-                    if temp is None or temp == "未知":
-                        return None
-                    if isinstance(temp, str):
-                        try:
-                            if "°C" in temp:
-                                return float(temp.replace("°C", "").strip())
-                            return float(temp)
-                        except ValueError:
-                            return None
-                    elif isinstance(temp, (int, float)):
-                        return temp
-                    return None
-
-                elif self.sensor_type == HDD_STATUS:
-                    return disk.get("status", "未知")
-        return None
-    
-    @property
-    def device_class(self):
+        return _cached_native(self, self._compute_native)
+
+    def _compute_native(self, data):
+        # 协调器已按设备名建好索引，直接O(1)取值
+        disk = data.get("disks_by_device", {}).get(self.device_id)
+        if disk is None:
+            return None
         if self.sensor_type == HDD_TEMP:
-            return SensorDeviceClass.TEMPERATURE
+            temp = disk.get("temperature")
+            if temp is None or temp == _UNKNOWN:
+                return None
+            if isinstance(temp, (int, float)):
+                return temp
+            raw, parsed = self._temp_cache
+            if raw == temp:
+                return parsed
+            match = _TEMP_RE.search(temp)
+            parsed = float(match.group()) if match else None
+            self._temp_cache = (temp, parsed)
+            return parsed
+        elif self.sensor_type == HDD_STATUS:
+            return disk.get("status", _UNKNOWN)
         return None
     
-    @property
-    def native_unit_of_measurement(self):
-        """返回内存单位"""
-        return self._attr_native_unit_of_measurement
-    
     @property
     def extra_state_attributes(self):
-        return {
-            ATTR_DISK_MODEL: self.disk_info.get("model", "未知"),
-            ATTR_SERIAL_NO: self.disk_info.get("serial", "未知"),
-            ATTR_POWER_ON_HOURS: self.disk_info.get("power_on_hours", "未知"),
-            ATTR_TOTAL_CAPACITY: self.disk_info.get("capacity", "未知"),
-            ATTR_HEALTH_STATUS: self.disk_info.get("health", "未知"),
-            "设备ID": self.device_id,
-            "状态": self.disk_info.get("status", "未知")
-        }
+        # disk_info在实体生命周期内通常是同一份快照，只有字典被整体替换时才重建
+        info = self.disk_info
+        if self._attrs_cache is None or self._attrs_src_id != id(info):
+            get = info.get
+            self._attrs_cache = {
+                ATTR_DISK_MODEL: get("model", _UNKNOWN),
+                ATTR_SERIAL_NO: get("serial", _UNKNOWN),
+                ATTR_POWER_ON_HOURS: get("power_on_hours", _UNKNOWN),
+                ATTR_TOTAL_CAPACITY: get("capacity", _UNKNOWN),
+                ATTR_HEALTH_STATUS: get("health", _UNKNOWN),
+                "设备ID": self.device_id,
+                "状态": get("status", _UNKNOWN)
+            }
+            self._attrs_src_id = id(info)
+        return self._attrs_cache
 
 class SystemSensor(CoordinatorEntity, SensorEntity):
+    # CoordinatorEntity带__dict__，用不了__slots__；常量字段放到类属性至少不占实例字典
+    _attr_device_info = _NAS_DEVICE_INFO
+
     def __init__(self, coordinator, name, unique_id, unit, icon):
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_NAS)},
-            "name": "飞牛NAS系统监控",
-            "manufacturer": "飞牛"
-        }
+        # 两个缓存字段都要初始化，否则首次读取_last_value会抛AttributeError
         self._last_uptime = None
+        self._last_value = None
     
     @property
     def native_value(self):
@@ -431,12 +413,12 @@ class SystemSensor(CoordinatorEntity, SensorEntity):
             return "状态未知"
         
         try:
-            uptime_seconds = system_data.get("uptime_seconds", 0)
+            # 取整后比较，亚秒级抖动不会击穿缓存
+            uptime_seconds = int(float(system_data.get("uptime_seconds", 0)))
             if self._last_uptime == uptime_seconds:
                 return self._last_value
             
-            hours = float(uptime_seconds) / 3600
-            value = f"已运行 {hours:.1f}小时"
+            value = "已运行 " + format(uptime_seconds / 3600, ".1f") + "小时"
             self._last_value = value
             self._last_uptime = uptime_seconds
             return value
@@ -447,82 +429,99 @@ class SystemSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         system_data = self.coordinator.data.get("system", {})
         return {
-            "运行时间": system_data.get("uptime", "未知"),
+            "运行时间": system_data.get("uptime", _UNKNOWN),
             "系统状态": system_data.get("status", "unknown"),
             "主机地址": self.coordinator.host,
-            "CPU温度": system_data.get("cpu_temperature", "未知"),
-            "主板温度": system_data.get("motherboard_temperature", "未知")
+            "CPU温度": system_data.get("cpu_temperature", _UNKNOWN),
+            "主板温度": system_data.get("motherboard_temperature", _UNKNOWN)
         }
 
 class CPUTempSensor(CoordinatorEntity, SensorEntity):
+    _attr_device_info = _NAS_DEVICE_INFO
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+
     def __init__(self, coordinator, name, unique_id, unit, icon):
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_NAS)},
-            "name": "飞牛NAS系统监控",
-            "manufacturer": "飞牛"
-        }
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        # 缓存(原始字符串, 解析结果)，温度不变时跳过解析
+        self._temp_cache = (None, None)
+        # 协调器数据未换新时native_value直接走缓存
+        self._last_data_id = None
+        self._last_val = None
     
     @property
     def native_value(self):
-        system_data = self.coordinator.data.get("system", {})
-        temp_str = system_data.get("cpu_temperature", "未知")
+        return _cached_native(self, self._compute_native)
+
+    def _compute_native(self, data):
+        system_data = data.get("system", {})
+        temp_str = system_data.get("cpu_temperature", _UNKNOWN)
         
         if system_data.get("status") == "off":
             return None
         
-        if temp_str is None or temp_str == "未知":
+        if temp_str is None or temp_str == _UNKNOWN:
             return None
         
         if isinstance(temp_str, (int, float)):
             return temp_str
             
-        if "°C" in temp_str:
-            try:
-                return float(temp_str.replace("°C", "").strip())
-            except:
-                return None
-        return None
+        raw, parsed = self._temp_cache
+        if raw == temp_str:
+            return parsed
+        match = _TEMP_RE.search(temp_str)
+        parsed = float(match.group()) if match else None
+        self._temp_cache = (temp_str, parsed)
+        return parsed
 
 class MoboTempSensor(CoordinatorEntity, SensorEntity):
+    _attr_device_info = _NAS_DEVICE_INFO
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+
     def __init__(self, coordinator, name, unique_id, unit, icon):
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_NAS)},
-            "name": "飞牛NAS系统监控",
-            "manufacturer": "飞牛"
-        }
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        # 缓存(原始字符串, 解析结果)，温度不变时跳过解析
+        self._temp_cache = (None, None)
+        # 协调器数据未换新时native_value直接走缓存
+        self._last_data_id = None
+        self._last_val = None
     
     @property
     def native_value(self):
-        system_data = self.coordinator.data.get("system", {})
-        temp_str = system_data.get("motherboard_temperature", "未知")
+        return _cached_native(self, self._compute_native)
+
+    def _compute_native(self, data):
+        system_data = data.get("system", {})
+        temp_str = system_data.get("motherboard_temperature", _UNKNOWN)
         
         if system_data.get("status") == "off":
             return None
         
-        if temp_str is None or temp_str == "未知":
+        if temp_str is None or temp_str == _UNKNOWN:
             return None
         
         if isinstance(temp_str, (int, float)):
             return temp_str
             
-        try:
-            cleaned = temp_str.lower().replace('°c', '').replace('c', '').strip()
-            return float(cleaned)
-        except (ValueError, TypeError) as e:
-            _LOGGER.warning("主板温度解析失败: 原始值='%s', 错误: %s", temp_str, str(e))
-            return None
+        raw, parsed = self._temp_cache
+        if raw == temp_str:
+            return parsed
+        match = _TEMP_RE.search(temp_str)
+        if match:
+            parsed = float(match.group())
+        else:
+            parsed = None
+            if _LOGGER.isEnabledFor(logging.WARNING):
+                _LOGGER.warning("主板温度解析失败: 原始值='%s'", temp_str)
+        self._temp_cache = (temp_str, parsed)
+        return parsed
 
 class UPSSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, name, unique_id, unit, icon, data_key, device_class=None, state_class=None):
@@ -552,8 +551,8 @@ class UPSSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         attributes = {
-            "最后更新时间": self.coordinator.data.get("last_update", "未知"),
-            "UPS类型": self.coordinator.data.get("ups_type", "未知")
+            "最后更新时间": self.coordinator.data.get("last_update", _UNKNOWN),
+            "UPS类型": self.coordinator.data.get("ups_type", _UNKNOWN)
         }
         
         # 添加原始字符串值（如果存在）
@@ -580,31 +579,19 @@ class VMStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """返回虚拟机状态"""
-        for vm in self.coordinator.data.get("vms", []):
-            if vm["name"] == self.vm_name:
-                # 将状态转换为中文
-                state_map = {
-                    "running": "运行中",
-                    "shut off": "已关闭",
-                    "paused": "已暂停",
-                    "rebooting": "重启中",
-                    "crashed": "崩溃"
-                }
-                return state_map.get(vm["state"], vm["state"])
-        return "未知"
+        vm = self.coordinator.data.get("vms_by_name", {}).get(self.vm_name)
+        if vm is None:
+            return _UNKNOWN
+        # 将状态转换为中文
+        return _VM_STATE_MAP.get(vm["state"], vm["state"])
     
     @property
     def icon(self):
         """根据状态返回图标"""
-        for vm in self.coordinator.data.get("vms", []):
-            if vm["name"] == self.vm_name:
-                if vm["state"] == "running":
-                    return "mdi:server"
-                elif vm["state"] == "shut off":
-                    return "mdi:server-off"
-                elif vm["state"] == "rebooting":
-                    return "mdi:server-security"
-        return "mdi:server"
+        vm = self.coordinator.data.get("vms_by_name", {}).get(self.vm_name)
+        if vm is None:
+            return "mdi:server"
+        return _VM_ICON.get(vm["state"], "mdi:server")
 
 # 添加DockerContainerStatusSensor类
 class DockerContainerStatusSensor(CoordinatorEntity, SensorEntity):
@@ -621,49 +608,36 @@ class DockerContainerStatusSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        for container in self.coordinator.data.get("docker_containers", []):
-            if container["name"] == self.container_name:
-                # 状态映射为中文
-                status_map = {
-                    "running": "运行中",
-                    "exited": "已停止",
-                    "paused": "已暂停",
-                    "restarting": "重启中",
-                    "dead": "死亡"
-                }
-                return status_map.get(container["status"], container["status"])
-        return "未知"
+        container = self.coordinator.data.get("containers_by_name", {}).get(self.container_name)
+        if container is None:
+            return _UNKNOWN
+        # 状态映射为中文
+        return _DOCKER_STATUS_MAP.get(container["status"], container["status"])
 
 class MemoryAvailableSensor(CoordinatorEntity, SensorEntity):
     """剩余内存传感器（包含总内存和已用内存作为属性）"""
     
+    _attr_device_info = _NAS_DEVICE_INFO
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator, name, unique_id, unit, icon):
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_NAS)},
-            "name": "飞牛NAS系统监控",
-            "manufacturer": "飞牛"
-        }
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        # 协调器数据未换新时native_value直接走缓存
+        self._last_data_id = None
+        self._last_val = None
     
     @property
     def native_value(self):
         """返回可用内存（GB）"""
-        system_data = self.coordinator.data.get("system", {})
-        mem_available = system_data.get("memory_available")
-        
-        if mem_available is None or mem_available == "未知":
-            return None
-        
-        try:
-            # 将字节转换为GB
-            return round(float(mem_available) / (1024 ** 3), 2)
-        except (TypeError, ValueError):
-            return None
+        return _cached_native(self, self._compute_native)
+
+    def _compute_native(self, data):
+        # 将字节转换为GB
+        return _bytes_to_gb(data.get("system", {}).get("memory_available"))
     
     @property
     def native_unit_of_measurement(self):
@@ -672,80 +646,82 @@ class MemoryAvailableSensor(CoordinatorEntity, SensorEntity):
     
     @property
     def extra_state_attributes(self):
-        """返回总内存和已用内存（GB）以及原始字节值"""
+        """返回总内存和已用内存（GB）"""
         system_data = self.coordinator.data.get("system", {})
-        mem_total = system_data.get("memory_total")
-        mem_used = system_data.get("memory_used")
-        mem_available = system_data.get("memory_available")
-        
-        # 转换为GB
-        try:
-            mem_total_gb = round(float(mem_total) / (1024 ** 3), 2) if mem_total and mem_total != "未知" else None
-        except:
-            mem_total_gb = None
-            
-        try:
-            mem_used_gb = round(float(mem_used) / (1024 ** 3), 2) if mem_used and mem_used != "未知" else None
-        except:
-            mem_used_gb = None
-            
         return {
-            "总内存 (GB)": mem_total_gb,
-            "已用内存 (GB)": mem_used_gb
+            "总内存 (GB)": _bytes_to_gb(system_data.get("memory_total")),
+            "已用内存 (GB)": _bytes_to_gb(system_data.get("memory_used"))
         }
 
 class VolumeAvailableSensor(CoordinatorEntity, SensorEntity):
     """存储卷剩余容量传感器（包含总容量和已用容量作为属性）"""
     
+    # 设备信息，归属到飞牛NAS系统
+    _attr_device_info = _NAS_DEVICE_INFO
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator, name, unique_id, icon, mount_point):
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_icon = icon
         self.mount_point = mount_point
-        
-        # 设备信息，归属到飞牛NAS系统
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_NAS)},
-            "name": "飞牛NAS系统监控",
-            "manufacturer": "飞牛"
-        }
-        
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-    
+        # 缓存(原始容量字符串, 单位)，容量不变时跳过后缀判断
+        self._last_avail = None
+        self._last_unit = None
+        # 协调器数据没换新时单位必然不变，连字典遍历都省掉
+        self._unit_data_id = None
+        # 数值解析同理，缓存上次的(原始字符串, 解析结果)
+        self._last_avail_num = None
+        self._last_parsed = None
+        # 属性字典按vol_info身份缓存，协调器没换新数据时直接复用
+        self._attrs_cache = None
+        self._attrs_src_id = None
+        # 协调器数据未换新时native_value直接走缓存
+        self._last_data_id = None
+        self._last_val = None
+
     @property
     def native_value(self):
         """返回剩余容量（数值）"""
-        system_data = self.coordinator.data.get("system", {})
-        volumes = system_data.get("volumes", {})
-        vol_info = volumes.get(self.mount_point, {})
+        return _cached_native(self, self._compute_native)
+
+    def _compute_native(self, data):
+        vol_info = data.get("system", {}).get("volumes", {}).get(self.mount_point, {})
         
-        avail_str = vol_info.get("available", "未知")
-        if avail_str == "未知":
+        avail_str = vol_info.get("available", _UNKNOWN)
+        if avail_str == _UNKNOWN:
             return None
         
+        if avail_str == self._last_avail_num:
+            return self._last_parsed
+        match = _NUM_RE.match(avail_str)
         try:
-            numeric_part = ''.join(filter(lambda x: x.isdigit() or x == '.', avail_str))
-            return float(numeric_part)
-        except (TypeError, ValueError):
-            return None
+            parsed = float(match.group()) if match else None
+        except ValueError:
+            parsed = None
+        self._last_avail_num = avail_str
+        self._last_parsed = parsed
+        return parsed
     
     @property
     def native_unit_of_measurement(self):
         """动态返回单位"""
-        system_data = self.coordinator.data.get("system", {})
-        volumes = system_data.get("volumes", {})
-        vol_info = volumes.get(self.mount_point, {})
+        data = self.coordinator.data
+        if id(data) == self._unit_data_id:
+            return self._last_unit
+        self._unit_data_id = id(data)
+        vol_info = data.get("system", {}).get("volumes", {}).get(self.mount_point, {})
         
         avail_str = vol_info.get("available", "")
-        if avail_str.endswith("T") or avail_str.endswith("Ti"):
-            return "TB"
-        elif avail_str.endswith("G") or avail_str.endswith("Gi"):
-            return "GB"
-        elif avail_str.endswith("M") or avail_str.endswith("Mi"):
-            return "MB"
-        else:
-            return None  # 未知单位
+        if avail_str == self._last_avail:
+            return self._last_unit
+        unit = None
+        if avail_str:
+            unit = _UNIT_SUFFIX_2.get(avail_str[-2:]) or _UNIT_SUFFIX_1.get(avail_str[-1:])
+        self._last_avail = avail_str
+        self._last_unit = unit
+        return unit
     
     @property
     def extra_state_attributes(self):
@@ -753,17 +729,24 @@ class VolumeAvailableSensor(CoordinatorEntity, SensorEntity):
         volumes = system_data.get("volumes", {})
         vol_info = volumes.get(self.mount_point, {})
         
-        return {
-            "挂载点": self.mount_point,
-            "文件系统": vol_info.get("filesystem", "未知"),
-            "总容量": vol_info.get("size", "未知"),
-            "已用容量": vol_info.get("used", "未知"),
-            "使用率": vol_info.get("use_percent", "未知")
-        }
+        # 协调器每次刷新才会产生新的vol_info字典，其余读取直接复用缓存
+        if self._attrs_cache is None or self._attrs_src_id != id(vol_info):
+            get = vol_info.get
+            self._attrs_cache = {
+                "挂载点": self.mount_point,
+                "文件系统": get("filesystem", _UNKNOWN),
+                "总容量": get("size", _UNKNOWN),
+                "已用容量": get("used", _UNKNOWN),
+                "使用率": get("use_percent", _UNKNOWN)
+            }
+            self._attrs_src_id = id(vol_info)
+        return self._attrs_cache
 
 class ZFSPoolSensor(CoordinatorEntity, SensorEntity):
     """ZFS存储池传感器"""
     
+    _attr_device_info = _ZFS_DEVICE_INFO
+
     def __init__(self, coordinator, zpool_name, sensor_type, name, unique_id, unit, icon, zpool_info, device_class=None, state_class=None):
         super().__init__(coordinator)
         self.zpool_name = zpool_name
@@ -773,11 +756,6 @@ class ZFSPoolSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         self.zpool_info = zpool_info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_ZFS)},
-            "name": "ZFS存储池",
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
         
         # 设置设备类和状态类（如果提供）
         if device_class:
@@ -800,7 +778,7 @@ class ZFSPoolSensor(CoordinatorEntity, SensorEntity):
                         "REMOVED": "已移除",
                         "UNAVAIL": "不可用"
                     }
-                    return health_map.get(zpool.get("health", "UNKNOWN"), zpool.get("health", "未知"))
+                    return health_map.get(zpool.get("health", "UNKNOWN"), zpool.get("health", _UNKNOWN))
                 elif self.sensor_type == "capacity":
                     # 返回使用率数值（去掉百分号）
                     capacity = zpool.get("capacity", "0%")
@@ -833,16 +811,16 @@ class ZFSPoolSensor(CoordinatorEntity, SensorEntity):
         for zpool in self.coordinator.data.get("zpools", []):
             if zpool["name"] == self.zpool_name:
                 return {
-                    ATTR_ZPOOL_NAME: zpool.get("name", "未知"),
-                    ATTR_ZPOOL_HEALTH: zpool.get("health", "未知"),
-                    ATTR_ZPOOL_SIZE: zpool.get("size", "未知"),
-                    ATTR_ZPOOL_ALLOC: zpool.get("alloc", "未知"),
-                    ATTR_ZPOOL_FREE: zpool.get("free", "未知"),
-                    ATTR_ZPOOL_CAPACITY: zpool.get("capacity", "未知"),
-                    ATTR_ZPOOL_FRAGMENTATION: zpool.get("frag", "未知"),
+                    ATTR_ZPOOL_NAME: zpool.get("name", _UNKNOWN),
+                    ATTR_ZPOOL_HEALTH: zpool.get("health", _UNKNOWN),
+                    ATTR_ZPOOL_SIZE: zpool.get("size", _UNKNOWN),
+                    ATTR_ZPOOL_ALLOC: zpool.get("alloc", _UNKNOWN),
+                    ATTR_ZPOOL_FREE: zpool.get("free", _UNKNOWN),
+                    ATTR_ZPOOL_CAPACITY: zpool.get("capacity", _UNKNOWN),
+                    ATTR_ZPOOL_FRAGMENTATION: zpool.get("frag", _UNKNOWN),
                     ATTR_ZPOOL_CKPOINT: zpool.get("ckpoint", "") if zpool.get("ckpoint") != "" else "无",
                     ATTR_ZPOOL_EXPANDSZ: zpool.get("expand_sz", "") if zpool.get("expand_sz") != "" else "无",
-                    ATTR_ZPOOL_DEDUP: zpool.get("dedup", "未知"),
+                    ATTR_ZPOOL_DEDUP: zpool.get("dedup", _UNKNOWN),
                     "根路径": zpool.get("altroot", "") if zpool.get("altroot") != "" else "默认"
                 }
         return {}
@@ -850,20 +828,17 @@ class ZFSPoolSensor(CoordinatorEntity, SensorEntity):
 class ZFSScrubSensor(CoordinatorEntity, SensorEntity):
     """ZFS存储池scrub进度传感器"""
     
+    _attr_device_info = _ZFS_DEVICE_INFO
+    _attr_native_unit_of_measurement = "%"
+    _attr_icon = "mdi:progress-check"
+    _attr_device_class = SensorDeviceClass.POWER_FACTOR
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator, zpool_name, name, unique_id):
         super().__init__(coordinator)
         self.zpool_name = zpool_name
         self._attr_name = name
         self._attr_unique_id = unique_id
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_icon = "mdi:progress-check"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, DEVICE_ID_ZFS)},
-            "name": "ZFS存储池",
-            "via_device": (DOMAIN, DEVICE_ID_NAS)
-        }
-        self._attr_device_class = SensorDeviceClass.POWER_FACTOR
-        self._attr_state_class = SensorStateClass.MEASUREMENT
         self.scrub_cache = {}
     
     @property
@@ -8,7 +8,7 @@ from .const import DOMAIN, DATA_UPDATE_COORDINATOR, CONF_MAC, DEVICE_ID_NAS
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
-    domain_data = hass.data[DOMAIN][config_entry.entry_id]
+    domain_data = config_entry.runtime_data
     coordinator = domain_data[DATA_UPDATE_COORDINATOR]
     
     entities = []
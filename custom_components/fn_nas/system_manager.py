@@ -1,10 +1,45 @@
 import logging
 import asyncio
 import os
+import re
+import time
 from datetime import datetime
 
 _LOGGER = logging.getLogger(__name__)
 
+# CPU温度行：AMD(tctl/tdie/k10temp)、Intel(package id/core 0/coretemp)或通用cpu/processor标签
+# 加"+xx.x°C"读数，一条带命名组的正则在C层扫完整个sensors输出
+_CPU_TEMP_RE = re.compile(
+    r'^(?P<label>[^\n]*?(?:tctl|tdie|k10temp|package id|core 0|coretemp|cpu|processor)'
+    r'[^\n]*?)\+\s*(?P<temp>\d+(?:\.\d+)?)\s*°c',
+    re.IGNORECASE | re.MULTILINE
+)
+# 正则前的廉价子串预检，输出里连这些关键字都没有就不用进正则引擎
+_CPU_KEYWORDS = ("tctl", "tdie", "k10temp", "package id", "core 0", "coretemp", "cpu", "processor")
+
+# 根级别/vol挂载点：/vol、/vol1这类纯数字编号，或不带斜杠的短字母数字后缀（如/vola、/vol1a）
+_ROOT_VOL_RE = re.compile(r'^/vol(?:\d+|[A-Za-z0-9]{0,3})$')
+
+# 温度解析用的正则，模块级预编译（输入已统一转为小写）
+# 前置负向断言排除长数字中间起匹配，c后加\b排除pci/abc这类子串，限定1-3位整数避免回溯
+_NUM_DEG_C_RE = re.compile(r'(?<![\d.])(\d{1,3}(?:\.\d+)?)\s*°c\b')
+_NUM_C_RE = re.compile(r'(?<![\d.])(\d{1,3}(?:\.\d+)?)\s*c\b')
+_NUM_OPT_DEG_C_RE = re.compile(r'(?<![\d.])(\d{1,3}(?:\.\d+)?)\s*°?\s*c\b')
+
+# sensors -u输出中的芯片名前缀分类：CPU温度芯片与主板/超级IO芯片
+_CPU_U_CHIPS = ("coretemp", "k10temp", "zenpower")
+_MOBO_U_CHIPS = ("acpitz", "nct", "it87", "it86", "w83", "f71")
+
+_SIZE_UNITS = ('', 'K', 'M', 'G', 'T')
+
+def _bytes_to_human(b):
+    """字节数转df风格的易读字符串（如931.5G）"""
+    for unit in _SIZE_UNITS:
+        if abs(b) < 1024.0:
+            return f"{b:.1f}{unit}"
+        b /= 1024.0
+    return f"{b:.1f}P"
+
 class SystemManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
@@ -26,11 +61,18 @@ class SystemManager:
             "temp_id": None,
             "label": None
         }
+        # 同一轮询周期内活跃卷列表只解析一次，短TTL缓存
+        self._active_vols_cache = None
+        self._active_vols_cache_ts = 0.0
+        # 同一轮询周期内多个取温度的入口共享一次sensors结果，短TTL缓存
+        self._temps_cache = None
+        self._temps_cache_ts = 0.0
+        self._temps_lock = asyncio.Lock()
 
-    def _debug_log(self, message: str):
-        """只在调试模式下输出详细日志"""
+    def _debug_log(self, message: str, *args):
+        """只在调试模式下输出详细日志（参数惰性格式化，调试关闭时零开销）"""
         if self.debug_enabled:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
 
     def _info_log(self, message: str):
         """重要信息日志"""
@@ -48,8 +90,15 @@ class SystemManager:
         """获取系统信息"""
         system_info = {}
         try:
-            # 获取原始运行时间（秒数）
-            uptime_output = await self.coordinator.run_command("cat /proc/uptime")
+            # 运行时间、温度、内存、挂载信息合并为一次SSH往返
+            uptime_output, sensors_output, mem_output, mount_output = (
+                await self.coordinator.run_commands_batch([
+                    "cat /proc/uptime",
+                    "sensors -u 2>/dev/null || sensors",
+                    "free -b",
+                    "mount | grep '/vol' 2>/dev/null || true",
+                ])
+            )
             if uptime_output:
                 try:
                     uptime_seconds = float(uptime_output.split()[0])
@@ -62,14 +111,13 @@ class SystemManager:
                 system_info["uptime_seconds"] = 0
                 system_info["uptime"] = "未知"
 
-            # 一次性获取CPU和主板温度
-            temps = await self.get_temperatures_from_sensors()
+            # 一次性解析CPU和主板温度（解析结果同时刷新TTL缓存）
+            temps = self._parse_temperatures(sensors_output)
             system_info["cpu_temperature"] = temps["cpu"]
             system_info["motherboard_temperature"] = temps["motherboard"]
 
-            mem_info = await self.get_memory_info()
-            system_info.update(mem_info)
-            vol_info = await self.get_vol_usage()
+            system_info.update(self.parse_memory_info(mem_output))
+            vol_info = await self.get_vol_usage(mount_output)
             system_info["volumes"] = vol_info
             return system_info
 
@@ -88,39 +136,91 @@ class SystemManager:
 
     async def get_temperatures_from_sensors(self) -> dict:
         """一次性获取CPU和主板温度"""
+        # 缓存未过期直接返回，几个向后兼容的包装方法不再各付一次SSH往返
+        if self._temps_cache and time.monotonic() - self._temps_cache_ts < 2.0:
+            return self._temps_cache
+        async with self._temps_lock:
+            # 锁内复查，避免缓存失效瞬间多个并发调用都去跑sensors
+            if self._temps_cache and time.monotonic() - self._temps_cache_ts < 2.0:
+                return self._temps_cache
+            return await self._fetch_temperatures()
+
+    async def _fetch_temperatures(self) -> dict:
+        """实际执行sensors命令并解析温度"""
         try:
-            command = "sensors"
-            self._debug_log(f"执行sensors命令获取温度: {command}")
+            command = "sensors -u 2>/dev/null || sensors"
+            self._debug_log("执行sensors命令获取温度: %s", command)
             
             sensors_output = await self.coordinator.run_command(command)
-            if self.debug_enabled:
-                self._debug_log(f"sensors命令输出长度: {len(sensors_output) if sensors_output else 0}")
-            
-            if not sensors_output:
-                self._warning_log("sensors命令无输出")
-                return {"cpu": "未知", "motherboard": "未知"}
+            self._debug_log("sensors命令输出长度: %d", len(sensors_output) if sensors_output else 0)
             
-            # 同时解析CPU和主板温度
-            cpu_temp = self.extract_cpu_temp_from_sensors(sensors_output)
-            mobo_temp = self.extract_mobo_temp_from_sensors(sensors_output)
-            
-            # 记录获取结果
-            if cpu_temp != "未知":
-                self._info_log(f"通过sensors获取CPU温度成功: {cpu_temp}")
-            else:
-                self._warning_log("sensors命令未找到CPU温度")
-                
-            if mobo_temp != "未知":
-                self._info_log(f"通过sensors获取主板温度成功: {mobo_temp}")
-            else:
-                self._warning_log("sensors命令未找到主板温度")
-            
-            return {"cpu": cpu_temp, "motherboard": mobo_temp}
+            return self._parse_temperatures(sensors_output)
             
         except Exception as e:
             self._error_log(f"使用sensors命令获取温度失败: {e}")
             return {"cpu": "未知", "motherboard": "未知"}
 
+    @staticmethod
+    def _parse_sensors_u(sensors_output: str):
+        """解析sensors -u的机器可读输出，返回(CPU温度, 主板温度)数值或None
+
+        -u输出是稳定的 芯片名 / 标签: / tempN_input: 数值 层级结构，
+        按行走一遍即可，不需要正则。
+        """
+        cpu_temp = None
+        mobo_temp = None
+        current_chip = ""
+        for line in sensors_output.split('\n'):
+            if not line:
+                continue
+            if not line[0].isspace() and ':' not in line:
+                # 顶格且不含冒号的行是芯片名，如coretemp-isa-0000
+                current_chip = line.strip().lower()
+                continue
+            idx = line.find('_input:')
+            if idx < 0:
+                continue
+            try:
+                value = float(line[idx + 7:])
+            except ValueError:
+                continue
+            if not 0 < value < 150:
+                continue
+            if cpu_temp is None and current_chip.startswith(_CPU_U_CHIPS):
+                cpu_temp = value
+            elif mobo_temp is None and current_chip.startswith(_MOBO_U_CHIPS):
+                mobo_temp = value
+            if cpu_temp is not None and mobo_temp is not None:
+                break
+        return cpu_temp, mobo_temp
+
+    def _parse_temperatures(self, sensors_output: str) -> dict:
+        """解析sensors输出中的CPU和主板温度，成功时刷新TTL缓存"""
+        if not sensors_output:
+            self._warning_log("sensors命令无输出")
+            return {"cpu": "未知", "motherboard": "未知"}
+        
+        # 优先按sensors -u的机器可读格式解析，拿不到再退回人类可读格式的提取器
+        cpu_val, mobo_val = self._parse_sensors_u(sensors_output)
+        cpu_temp = f"{cpu_val:.1f} °C" if cpu_val is not None else self.extract_cpu_temp_from_sensors(sensors_output)
+        mobo_temp = f"{mobo_val:.1f} °C" if mobo_val is not None else self.extract_mobo_temp_from_sensors(sensors_output)
+        
+        # 记录获取结果
+        if cpu_temp != "未知":
+            self._info_log(f"通过sensors获取CPU温度成功: {cpu_temp}")
+        else:
+            self._warning_log("sensors命令未找到CPU温度")
+            
+        if mobo_temp != "未知":
+            self._info_log(f"通过sensors获取主板温度成功: {mobo_temp}")
+        else:
+            self._warning_log("sensors命令未找到主板温度")
+        
+        result = {"cpu": cpu_temp, "motherboard": mobo_temp}
+        self._temps_cache = result
+        self._temps_cache_ts = time.monotonic()
+        return result
+
     async def get_cpu_temp_from_kernel(self) -> str:
         """获取CPU温度 - 向后兼容"""
         temps = await self.get_temperatures_from_sensors()
@@ -144,62 +244,26 @@ class SystemManager:
     def extract_cpu_temp_from_sensors(self, sensors_output: str) -> str:
         """从sensors输出中提取CPU温度"""
         try:
-            lines = sensors_output.split('\n')
-            self._debug_log(f"解析sensors输出，共{len(lines)}行")
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
-                if self.debug_enabled:
-                    self._debug_log(f"第{i+1}行: {line_lower}")
-                
-                # AMD CPU温度关键词
-                if any(keyword in line_lower for keyword in [
-                    "tctl", "tdie", "k10temp"
-                ]):
-                    self._debug_log(f"找到AMD CPU温度行: {line}")
-                    if '+' in line and '°c' in line_lower:
-                        try:
-                            temp_match = line.split('+')[1].split('°')[0].strip()
-                            temp = float(temp_match)
-                            if 0 < temp < 150:
-                                self._info_log(f"从sensors提取AMD CPU温度: {temp:.1f}°C")
-                                return f"{temp:.1f} °C"
-                        except (ValueError, IndexError) as e:
-                            self._debug_log(f"解析AMD温度失败: {e}")
-                            continue
-                
-                # Intel CPU温度关键词
-                if any(keyword in line_lower for keyword in [
-                    "package id", "core 0", "coretemp"
-                ]) and not any(exclude in line_lower for exclude in ["fan"]):
-                    self._debug_log(f"找到Intel CPU温度行: {line}")
-                    if '+' in line and '°c' in line_lower:
-                        try:
-                            temp_match = line.split('+')[1].split('°')[0].strip()
-                            temp = float(temp_match)
-                            if 0 < temp < 150:
-                                self._info_log(f"从sensors提取Intel CPU温度: {temp:.1f}°C")
-                                return f"{temp:.1f} °C"
-                        except (ValueError, IndexError) as e:
-                            self._debug_log(f"解析Intel温度失败: {e}")
-                            continue
-                
-                # 通用CPU温度模式
-                if ('cpu' in line_lower or 'processor' in line_lower) and '+' in line and '°c' in line_lower:
-                    self._debug_log(f"找到通用CPU温度行: {line}")
-                    try:
-                        temp_match = line.split('+')[1].split('°')[0].strip()
-                        temp = float(temp_match)
-                        if 0 < temp < 150:
-                            self._info_log(f"从sensors提取通用CPU温度: {temp:.1f}°C")
-                            return f"{temp:.1f} °C"
-                    except (ValueError, IndexError) as e:
-                        self._debug_log(f"解析通用CPU温度失败: {e}")
-                        continue
-            
+            output_lower = sensors_output.lower()
+            # 廉价的子串预检，没有任何CPU关键字直接放弃
+            if not any(keyword in output_lower for keyword in _CPU_KEYWORDS):
+                self._warning_log("未在sensors输出中找到CPU温度")
+                return "未知"
+
+            # 单条正则一次扫完整个输出，替代逐行lower+多关键字any()的Python循环
+            for match in _CPU_TEMP_RE.finditer(sensors_output):
+                # 风扇行（如cpu fan）不是温度
+                if "fan" in match.group("label").lower():
+                    continue
+                temp = float(match.group("temp"))
+                if 0 < temp < 150:
+                    self._info_log(f"从sensors提取CPU温度: {temp:.1f}°C")
+                    return f"{temp:.1f} °C"
+                self._debug_log("CPU温度值超出合理范围: %.1f°C", temp)
+
             self._warning_log("未在sensors输出中找到CPU温度")
             return "未知"
-            
+
         except Exception as e:
             self._error_log(f"解析sensors CPU温度输出失败: {e}")
             return "未知"
@@ -207,11 +271,18 @@ class SystemManager:
     def extract_mobo_temp_from_sensors(self, sensors_output: str) -> str:
         """从sensors输出中提取主板温度"""
         try:
-            lines = sensors_output.split('\n')
-            self._debug_log(f"解析主板温度，共{len(lines)}行")
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
+            # 整个输出只lower一次，循环内不再为每行分配新字符串
+            lines = sensors_output.lower().split('\n')
+            self._debug_log("解析主板温度，共%d行", len(lines))
+            # 候选值放本地列表，不再通过self属性传递（并发调用下会互相踩）
+            candidates = []
+            
+            for line_lower in lines:
+                # 先做廉价子串预检：没有温度读数或是风扇转速行，直接跳过关键词扫描
+                if '°c' not in line_lower and ' c' not in line_lower and 'c ' not in line_lower:
+                    continue
+                if 'fan' in line_lower or 'rpm' in line_lower:
+                    continue
                 
                 # 主板温度关键词 - 扩展关键词列表
                 if any(keyword in line_lower for keyword in [
@@ -223,15 +294,15 @@ class SystemManager:
                     "cpu", "core", "package", "processor", "tctl", "tdie"
                 ]) and not any(exclude in line_lower for exclude in ["fan", "rpm"]):
                     
-                    self._debug_log(f"找到可能的主板温度行: {line}")
+                    self._debug_log("找到可能的主板温度行: %s", line_lower)
                     
                     # 多种温度格式匹配
                     temp_value = None
                     
                     # 格式1: +45.0°C (high = +80.0°C, crit = +95.0°C)
-                    if '+' in line and '°c' in line_lower:
+                    if '+' in line_lower and '°c' in line_lower:
                         try:
-                            temp_match = line.split('+')[1].split('°')[0].strip()
+                            temp_match = line_lower.split('+')[1].split('°')[0].strip()
                             temp_value = float(temp_match)
                         except (ValueError, IndexError):
                             pass
@@ -240,8 +311,7 @@ class SystemManager:
                     if temp_value is None and '°c' in line_lower:
                         try:
                             # 查找数字后跟°C的模式
-                            import re
-                            temp_match = re.search(r'(\d+\.?\d*)\s*°c', line_lower)
+                            temp_match = _NUM_DEG_C_RE.search(line_lower)
                             if temp_match:
                                 temp_value = float(temp_match.group(1))
                         except (ValueError, AttributeError):
@@ -251,8 +321,7 @@ class SystemManager:
                     if temp_value is None and (' c' in line_lower or 'c ' in line_lower):
                         try:
                             # 查找数字后跟C的模式
-                            import re
-                            temp_match = re.search(r'(\d+\.?\d*)\s*c', line_lower)
+                            temp_match = _NUM_C_RE.search(line_lower)
                             if temp_match:
                                 temp_value = float(temp_match.group(1))
                         except (ValueError, AttributeError):
@@ -262,33 +331,21 @@ class SystemManager:
                         # 主板温度通常在15-70度之间，但放宽范围到10-80度
                         if 10 <= temp_value <= 80:
                             # 存储候选值，不立即返回
-                            import re
-                            if not hasattr(self, '_temp_candidates'):
-                                self._temp_candidates = []
-                            self._temp_candidates.append((temp_value, line))
-                            self._debug_log(f"找到有效主板温度候选: {temp_value:.1f}°C")
+                            candidates.append((temp_value, line_lower))
+                            self._debug_log("找到有效主板温度候选: %.1f°C", temp_value)
                         else:
-                            self._debug_log(f"主板温度值超出合理范围: {temp_value:.1f}°C")
+                            self._debug_log("主板温度值超出合理范围: %.1f°C", temp_value)
                         continue
             
-            # 处理候选值
-            if hasattr(self, '_temp_candidates') and self._temp_candidates:
-                # 优先选择温度在25-45度之间的值（典型主板温度）
-                ideal_candidates = [t for t in self._temp_candidates if 25 <= t[0] <= 45]
-                if ideal_candidates:
-                    best_temp = ideal_candidates[0][0]  # 取第一个理想候选值
-                else:
-                    # 如果没有理想值，取第一个候选值
-                    best_temp = self._temp_candidates[0][0]
-                
+            # 处理候选值：优先选择25-45度之间的值（典型主板温度），否则取第一个
+            if candidates:
+                best_temp = next((t for t, _ in candidates if 25 <= t <= 45), candidates[0][0])
                 self._info_log(f"从sensors提取主板温度: {best_temp:.1f}°C")
-                # 清理候选值
-                delattr(self, '_temp_candidates')
                 return f"{best_temp:.1f} °C"
             
-            # 如果没有找到主板温度，尝试备用方法
+            # 如果没有找到主板温度，尝试备用方法（复用已小写化分行的结果，不再整份重扫）
             self._debug_log("尝试备用方法获取主板温度")
-            mobo_temp = self._extract_mobo_temp_fallback(sensors_output)
+            mobo_temp = self._extract_mobo_temp_fallback(lines)
             if mobo_temp != "未知":
                 return mobo_temp
             
@@ -299,14 +356,14 @@ class SystemManager:
             self._error_log(f"解析sensors主板温度输出失败: {e}")
             return "未知"
 
-    def _extract_mobo_temp_fallback(self, sensors_output: str) -> str:
-        """备用方法获取主板温度"""
+    def _extract_mobo_temp_fallback(self, lines: list) -> str:
+        """备用方法获取主板温度，入参为已小写化的行列表"""
         try:
-            lines = sensors_output.split('\n')
-            
             # 方法1: 查找非CPU的温度传感器
-            for line in lines:
-                line_lower = line.lower().strip()
+            for line_lower in lines:
+                # 无温度读数的行先跳过，再做CPU关键词排除
+                if '°c' not in line_lower and ' c' not in line_lower:
+                    continue
                 
                 # 跳过明显的CPU相关行
                 if any(cpu_keyword in line_lower for cpu_keyword in [
@@ -314,27 +371,22 @@ class SystemManager:
                 ]):
                     continue
                 
-                # 查找温度值
-                if '°c' in line_lower or ' c' in line_lower:
-                    # 尝试提取温度值
-                    import re
-                    temp_match = re.search(r'(\d+\.?\d*)\s*[°]?\s*c', line_lower)
-                    if temp_match:
-                        temp_value = float(temp_match.group(1))
-                        if 15 <= temp_value <= 60:  # 主板温度合理范围
-                            self._info_log(f"通过备用方法获取主板温度: {temp_value:.1f}°C")
-                            return f"{temp_value:.1f} °C"
+                # 尝试提取温度值
+                temp_match = _NUM_OPT_DEG_C_RE.search(line_lower)
+                if temp_match:
+                    temp_value = float(temp_match.group(1))
+                    if 15 <= temp_value <= 60:  # 主板温度合理范围
+                        self._info_log(f"通过备用方法获取主板温度: {temp_value:.1f}°C")
+                        return f"{temp_value:.1f} °C"
             
             # 方法2: 查找hwmon设备中的主板温度
-            for i, line in enumerate(lines):
-                line_lower = line.lower()
+            for i, line_lower in enumerate(lines):
                 if "hwmon" in line_lower and "temp" in line_lower:
                     # 检查接下来的几行是否有温度值
                     for j in range(i+1, min(i+5, len(lines))):
-                        next_line = lines[j].lower()
+                        next_line = lines[j]
                         if '°c' in next_line or ' c' in next_line:
-                            import re
-                            temp_match = re.search(r'(\d+\.?\d*)\s*[°]?\s*c', next_line)
+                            temp_match = _NUM_OPT_DEG_C_RE.search(next_line)
                             if temp_match:
                                 temp_value = float(temp_match.group(1))
                                 if 15 <= temp_value <= 60:
@@ -344,24 +396,25 @@ class SystemManager:
             return "未知"
             
         except Exception as e:
-            self._debug_log(f"备用方法获取主板温度失败: {e}")
+            self._debug_log("备用方法获取主板温度失败: %s", e)
             return "未知"
 
     def format_uptime(self, seconds: float) -> str:
         """格式化运行时间为易读格式"""
         try:
-            days, remainder = divmod(seconds, 86400)
+            # 先转int再整除，后面不用再逐项int()
+            seconds = int(seconds)
             days, remainder = divmod(seconds, 86400)
             hours, remainder = divmod(remainder, 3600)
-            minutes, seconds = divmod(remainder, 60)
+            minutes = remainder // 60
             
             parts = []
             if days >= 1:
-                parts.append(f"{int(days)}天")
+                parts.append(f"{days}天")
             if hours >= 1:
-                parts.append(f"{int(hours)}小时")
+                parts.append(f"{hours}小时")
             if minutes >= 1 or not parts:  # 如果时间很短也要显示分钟
-                parts.append(f"{int(minutes)}分钟")
+                parts.append(f"{minutes}分钟")
                 
             return " ".join(parts)
         except Exception as e:
@@ -370,19 +423,50 @@ class SystemManager:
     
     async def get_memory_info(self) -> dict:
         """获取内存使用信息"""
+        # SFTP直读/proc/meminfo，省掉远端shell+free进程；读不到再退回free命令
+        meminfo = await self.coordinator.read_small_file("/proc/meminfo")
+        result = self.parse_proc_meminfo(meminfo)
+        if result:
+            return result
+        mem_output = await self.coordinator.run_command("free -b")
+        return self.parse_memory_info(mem_output)
+
+    def parse_proc_meminfo(self, meminfo: str) -> dict:
+        """解析/proc/meminfo，返回与parse_memory_info相同的字节数键值"""
+        try:
+            if not meminfo:
+                return {}
+            values = {}
+            for line in meminfo.split('\n'):
+                key, sep, rest = line.partition(':')
+                if sep and key in ("MemTotal", "MemAvailable"):
+                    # 值形如"16384000 kB"，统一按kB计
+                    values[key] = int(rest.split()[0]) * 1024
+                    if len(values) == 2:
+                        break
+            if "MemTotal" not in values or "MemAvailable" not in values:
+                return {}
+            return {
+                "memory_total": values["MemTotal"],
+                "memory_used": values["MemTotal"] - values["MemAvailable"],
+                "memory_available": values["MemAvailable"]
+            }
+        except Exception as e:
+            self._error_log(f"解析/proc/meminfo失败: {str(e)}")
+            return {}
+
+    def parse_memory_info(self, mem_output: str) -> dict:
+        """解析free -b的输出"""
         try:
-            # 使用 free 命令获取内存信息（-b 选项以字节为单位）
-            mem_output = await self.coordinator.run_command("free -b")
             if not mem_output:
                 return {}
             
-            # 解析输出
-            lines = mem_output.splitlines()
-            if len(lines) < 2:
+            # 直接定位Mem:行切片，免去整份输出的splitlines分配
+            start = mem_output.find("Mem:")
+            if start < 0:
                 return {}
-                
-            # 第二行是内存信息（Mem行）
-            mem_line = lines[1].split()
+            end = mem_output.find("\n", start)
+            mem_line = (mem_output[start:] if end < 0 else mem_output[start:end]).split()
             if len(mem_line) < 7:
                 return {}
                 
@@ -396,11 +480,14 @@ class SystemManager:
             self._error_log(f"获取内存信息失败: {str(e)}")
             return {}
     
-    async def get_vol_usage(self) -> dict:
-        """获取 /vol* 开头的存储卷使用信息，避免唤醒休眠磁盘"""
+    async def get_vol_usage(self, mount_output: str = None) -> dict:
+        """获取 /vol* 开头的存储卷使用信息，避免唤醒休眠磁盘
+
+        mount_output可传入批量命令取回的mount结果，省一次SSH往返。
+        """
         try:
             # 首先尝试智能检测活跃卷
-            active_vols = await self.check_active_volumes()
+            active_vols = await self.check_active_volumes(mount_output)
             
             if active_vols:
                 # 只查询活跃的卷，避免使用通配符可能唤醒所有磁盘
@@ -434,7 +521,8 @@ class SystemManager:
                     return result
             
             # 最后的回退：尝试检测任何挂载的卷
-            mount_output = await self.coordinator.run_command("mount | grep '/vol' || true")
+            if mount_output is None:
+                mount_output = await self.coordinator.run_command("mount | grep '/vol' || true")
             if mount_output:
                 vol_points = []
                 for line in mount_output.splitlines():
@@ -444,7 +532,7 @@ class SystemManager:
                             vol_points.append(part)
                 
                 if vol_points:
-                    self._debug_log(f"从mount输出检测到卷: {vol_points}")
+                    self._debug_log("从mount输出检测到卷: %s", vol_points)
                     vol_list = " ".join(vol_points)
                     df_output = await self.coordinator.run_command(f"df -h {vol_list} 2>/dev/null || true")
                     if df_output:
@@ -457,13 +545,19 @@ class SystemManager:
             self._error_log(f"获取存储卷信息失败: {str(e)}")
             return {}
     
-    async def check_active_volumes(self) -> list:
+    async def check_active_volumes(self, mount_output: str = None) -> list:
         """检查当前活跃的存储卷，避免唤醒休眠磁盘"""
+        # 同一轮询周期内get_vol_usage的主路径和回退路径会重复进来，5秒TTL内直接复用
+        if self._active_vols_cache is not None and time.monotonic() - self._active_vols_cache_ts < 5.0:
+            return self._active_vols_cache
         try:
             # 获取所有挂载点，这个操作不会访问磁盘内容
-            mount_output = await self.coordinator.run_command("mount | grep '/vol' 2>/dev/null || true")
+            if mount_output is None:
+                mount_output = await self.coordinator.run_command("mount | grep '/vol' 2>/dev/null || true")
             if not mount_output:
                 self._debug_log("未找到任何/vol挂载点")
+                self._active_vols_cache = []
+                self._active_vols_cache_ts = time.monotonic()
                 return []
             
             active_vols = []
@@ -495,51 +589,33 @@ class SystemManager:
                         is_active = await self.is_volume_disk_active(mount_point)
                         if is_active:
                             active_vols.append(mount_point)
-                            self._debug_log(f"添加活跃卷: {mount_point}")
+                            self._debug_log("添加活跃卷: %s", mount_point)
                         else:
                             # 即使磁盘不活跃，也添加到列表中，但标记为可能休眠
                             # 这样可以保证有基本的存储信息
                             active_vols.append(mount_point)
-                            self._debug_log(f"卷 {mount_point} 对应磁盘可能休眠，但仍包含在检测中")
+                            self._debug_log("卷 %s 对应磁盘可能休眠，但仍包含在检测中", mount_point)
                     else:
-                        self._debug_log(f"跳过非根级别vol挂载点: {mount_point}")
+                        self._debug_log("跳过非根级别vol挂载点: %s", mount_point)
             
             # 去重并排序
             active_vols = sorted(list(set(active_vols)))
-            self._debug_log(f"最终检测到的根级别/vol存储卷: {active_vols}")
+            self._debug_log("最终检测到的根级别/vol存储卷: %s", active_vols)
+            self._active_vols_cache = active_vols
+            self._active_vols_cache_ts = time.monotonic()
             return active_vols
             
         except Exception as e:
-            self._debug_log(f"检查活跃存储卷失败: {e}")
+            self._debug_log("检查活跃存储卷失败: %s", e)
             return []
     
     def is_root_vol_mount(self, mount_point: str) -> bool:
-        """检查是否为根级别的/vol挂载点"""
-        if not mount_point or not mount_point.startswith('/vol'):
-            return False
-        
-        # 移除开头的/vol部分进行分析
-        remainder = mount_point[4:]  # 去掉'/vol'
-        
-        # 如果remainder为空，说明是/vol，这是根级别
-        if not remainder:
-            return True
-        
-        # 如果remainder只是数字（如/vol1, /vol2），这是根级别
-        if remainder.isdigit():
-            return True
-        
-        # 如果remainder是单个字母或字母数字组合且没有斜杠，也认为是根级别
-        # 例如：/vola, /volb, /vol1a 等
-        if '/' not in remainder and len(remainder) <= 3:
-            return True
-        
-        # 其他情况都认为是子目录，如：
-        # /vol1/docker/overlay2/...
-        # /vol1/data/...
-        # /vol1/config/...
-        self._debug_log(f"检测到子目录挂载点: {mount_point}")
-        return False
+        """检查是否为根级别的/vol挂载点
+
+        /vol1/docker/overlay2这类子目录挂载点返回False。
+        """
+        # 每条df/mount行都会调用，正则一次匹配替代多段切片判断
+        return bool(mount_point and _ROOT_VOL_RE.match(mount_point))
 
     def parse_df_bytes(self, df_output: str) -> dict:
         """解析df命令的字节输出"""
@@ -553,7 +629,7 @@ class SystemManager:
                 mount_point = parts[-1]
                 # 严格检查只处理根级别的 /vol 挂载点
                 if not self.is_root_vol_mount(mount_point):
-                    self._debug_log(f"跳过非根级别vol挂载点: {mount_point}")
+                    self._debug_log("跳过非根级别vol挂载点: %s", mount_point)
                     continue
                     
                 try:
@@ -562,23 +638,16 @@ class SystemManager:
                     avail_bytes = int(parts[3])
                     use_percent = parts[4]
                     
-                    def bytes_to_human(b):
-                        for unit in ['', 'K', 'M', 'G', 'T']:
-                            if abs(b) < 1024.0:
-                                return f"{b:.1f}{unit}"
-                            b /= 1024.0
-                        return f"{b:.1f}P"
-                    
                     volumes[mount_point] = {
                         "filesystem": parts[0],
-                        "size": bytes_to_human(size_bytes),
-                        "used": bytes_to_human(used_bytes),
-                        "available": bytes_to_human(avail_bytes),
+                        "size": _bytes_to_human(size_bytes),
+                        "used": _bytes_to_human(used_bytes),
+                        "available": _bytes_to_human(avail_bytes),
                         "use_percent": use_percent
                     }
-                    self._debug_log(f"添加根级别/vol存储卷信息: {mount_point}")
+                    self._debug_log("添加根级别/vol存储卷信息: %s", mount_point)
                 except (ValueError, IndexError) as e:
-                    self._debug_log(f"解析存储卷行失败: {line} - {str(e)}")
+                    self._debug_log("解析存储卷行失败: %s - %s", line, e)
                     continue
         except Exception as e:
             self._error_log(f"解析df字节输出失败: {e}")
@@ -597,7 +666,7 @@ class SystemManager:
                 mount_point = parts[-1]
                 # 严格检查只处理根级别的 /vol 挂载点
                 if not self.is_root_vol_mount(mount_point):
-                    self._debug_log(f"跳过非根级别vol挂载点: {mount_point}")
+                    self._debug_log("跳过非根级别vol挂载点: %s", mount_point)
                     continue
                     
                 try:
@@ -613,9 +682,9 @@ class SystemManager:
                         "available": avail,
                         "use_percent": use_percent
                     }
-                    self._debug_log(f"添加根级别/vol存储卷信息: {mount_point}")
+                    self._debug_log("添加根级别/vol存储卷信息: %s", mount_point)
                 except (ValueError, IndexError) as e:
-                    self._debug_log(f"解析存储卷行失败: {line} - {str(e)}")
+                    self._debug_log("解析存储卷行失败: %s - %s", line, e)
                     continue
         except Exception as e:
             self._error_log(f"解析df输出失败: {e}")
@@ -4,6 +4,21 @@ from asyncssh import SSHClientConnection
 
 _LOGGER = logging.getLogger(__name__)
 
+# virsh dumpxml输出中的<title>标签，模块级预编译
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.DOTALL)
+
+# virsh list --all的数据行：id列只会是数字或-，天然跳过表头和分隔线
+_VIRSH_ROW_RE = re.compile(r'^\s*(-|\d+)\s+(\S+)\s+(.+?)\s*$', re.MULTILINE)
+
+# virsh list --all --title的数据行：State列可能是多词（shut off/in shutdown），
+# 按已知状态集合显式匹配，剩余部分才是标题
+_VIRSH_TITLE_ROW_RE = re.compile(
+    r'^[ \t]*(?:-|\d+)[ \t]+(\S+)[ \t]+'
+    r'(?:running|idle|paused|in shutdown|shut off|shutoff|crashed|pmsuspended|dying)'
+    r'[ \t]*(.*?)[ \t]*$',
+    re.MULTILINE
+)
+
 class VMManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
@@ -13,10 +28,10 @@ class VMManager:
         self.logger.setLevel(logging.DEBUG if _LOGGER.isEnabledFor(logging.DEBUG) else logging.INFO)
         self.debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
-    def _debug_log(self, message: str):
-        """只在调试模式下输出详细日志"""
+    def _debug_log(self, message: str, *args):
+        """只在调试模式下输出详细日志（参数惰性格式化，调试关闭时零开销）"""
         if self.debug_enabled:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
 
     def _info_log(self, message: str):
         """重要信息日志"""
@@ -35,7 +50,7 @@ class VMManager:
         try:
             self._debug_log("开始获取虚拟机列表")
             output = await self.coordinator.run_command("virsh list --all")
-            self._debug_log(f"virsh命令输出: {output}")
+            self._debug_log("virsh命令输出: %s", output)
             
             self.vms = self._parse_vm_list(output)
             self._info_log(f"获取到{len(self.vms)}个虚拟机")
@@ -46,41 +61,55 @@ class VMManager:
 
     def _parse_vm_list(self, output):
         """解析虚拟机列表输出"""
-        vms = []
-        # 跳过标题行
-        lines = output.strip().split('\n')[2:]
-        for line in lines:
-            if not line.strip():
-                continue
-            parts = line.split(maxsplit=2)  # 更健壮的解析方式
-            if len(parts) >= 3:
-                vm_id = parts[0].strip()
-                name = parts[1].strip()
-                state = parts[2].strip()
-                vms.append({
-                    "id": vm_id,
-                    "name": name,
-                    "state": state.lower(),
-                    "title": ""  # 将在后续填充
-                })
-        return vms
+        # 一次正则扫描整张表，id列的(-|数字)模式自动排除表头和分隔线
+        return [
+            {
+                "id": m[1],
+                "name": m[2],
+                "state": m[3].lower(),
+                "title": ""  # 将在后续填充
+            }
+            for m in _VIRSH_ROW_RE.finditer(output)
+        ]
+
+    async def get_all_titles(self):
+        """一次性获取所有虚拟机的标题，返回 {名称: 标题} 映射"""
+        try:
+            self._debug_log("批量获取虚拟机标题")
+            output = await self.coordinator.run_command("virsh list --all --title")
+            # 格式: Id Name State Title；State可能是shut off这类多词状态，
+            # 不能按空白数列切，正则里枚举状态后剩下的才是标题
+            return {
+                m[1]: m[2] or m[1]
+                for m in _VIRSH_TITLE_ROW_RE.finditer(output)
+            }
+        except Exception as e:
+            self._error_log(f"批量获取虚拟机标题失败: {str(e)}")
+            return {}
 
     async def get_vm_title(self, vm_name):
         """获取虚拟机的标题"""
         try:
-            self._debug_log(f"获取虚拟机{vm_name}的标题")
-            output = await self.coordinator.run_command(f"virsh dumpxml {vm_name}")
-            # 在XML输出中查找<title>标签
-            match = re.search(r'<title>(.*?)</title>', output, re.DOTALL)
-            if match:
-                title = match.group(1).strip()
-                self._debug_log(f"虚拟机{vm_name}标题: {title}")
+            self._debug_log("获取虚拟机%s的标题", vm_name)
+            # virsh desc --title 只返回标题本身，比dumpxml整份XML轻得多
+            output = await self.coordinator.run_command(f"virsh desc --title {vm_name}")
+            title = output.strip() if output else ""
+            if title:
+                self._debug_log("虚拟机%s标题: %s", vm_name, title)
                 return title
-            self._debug_log(f"虚拟机{vm_name}无标题，使用名称")
+            self._debug_log("虚拟机%s无标题，使用名称", vm_name)
             return vm_name  # 如果没有标题，则返回虚拟机名称
-        except Exception as e:
-            self._error_log(f"获取虚拟机标题失败: {str(e)}")
-            return vm_name
+        except Exception:
+            # 旧版virsh可能不支持desc --title，退回dumpxml解析
+            try:
+                output = await self.coordinator.run_command(f"virsh dumpxml {vm_name}")
+                match = _TITLE_RE.search(output)
+                if match:
+                    return match.group(1).strip() or vm_name
+                return vm_name
+            except Exception as e:
+                self._error_log(f"获取虚拟机标题失败: {str(e)}")
+                return vm_name
 
     async def control_vm(self, vm_name, action):
         """控制虚拟机操作"""